@@ -1 +1,10 @@
-from trackobjs._trackobjs import track_objects
\ No newline at end of file
+__all__ = ["track_objects"]
+
+
+def __getattr__(name):
+    """Import `track_objects` on first access, so `python -m trackobjs --help` stays light."""
+    if name == "track_objects":
+        from ._trackobjs import track_objects
+
+        return track_objects
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
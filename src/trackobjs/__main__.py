@@ -1,6 +1,4 @@
 import argparse
-import trackobjs
-import baodebug
 import os.path
 
 
@@ -9,6 +7,10 @@ def main():
     parser.add_argument('--datadir', type=str, required=True, help='path to the input images/, timestamps.txt, detections/.')
     args = parser.parse_args()
 
+    # imported after parsing so that --help and argument errors do not pay for the tracker stack
+    import baodebug
+    import trackobjs
+
     baodebug.debugutils.ConfigureRootLogger("info")  # config logger format
     baodebug.debugutils.SetDebugPath(os.path.join(args.datadir, "baodebug/"))  # create debug folder here and set to os.environ["DEBUG_PATH"]
 
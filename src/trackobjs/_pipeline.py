@@ -0,0 +1,75 @@
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+# end-of-stream marker; `None` is a valid payload (e.g. cv2.imread on a missing file)
+_SENTINEL = object()
+
+
+class PrefetchReader(threading.Thread):
+    """
+    Daemon thread that loads items ahead of the consumer through a bounded queue.
+
+    The reader applies `load_fn` to each of `items` in order and pushes the results into a queue of
+    at most `maxsize` entries, so disk reads overlap with whatever the consumer does with the
+    previous results. Iterating the reader yields the loaded results in order; an exception raised
+    by `load_fn` is re-raised in the consuming thread.
+
+    Attributes:
+        items (Iterable): Items to load, e.g. timestamps.
+        load_fn (Callable): Function mapping an item to its loaded value.
+        queue (queue.Queue): Bounded queue of loaded values.
+        stop_event (threading.Event): Set by `close` to stop the reader early.
+
+    Examples:
+        >>> reader = PrefetchReader(["a.png", "b.png"], cv2.imread)
+        >>> for img in reader:
+        ...     print(img.shape)
+        >>> reader.close()
+    """
+
+    def __init__(self, items: Iterable, load_fn: Callable[[Any], Any], maxsize: int = 8):
+        """Start prefetching `load_fn(item)` for each of `items`, with at most `maxsize` queued."""
+        super().__init__(daemon=True)
+        self.items = items
+        self.load_fn = load_fn
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.stop_event = threading.Event()
+        self._error = None
+        self.start()
+
+    def run(self) -> None:
+        """Load the items in order, then push the end-of-stream sentinel."""
+        try:
+            for item in self.items:
+                if self.stop_event.is_set():
+                    return
+                self._put(self.load_fn(item))
+        except Exception as e:
+            self._error = e
+        self._put(_SENTINEL)
+
+    def _put(self, value: Any) -> None:
+        """Block until `value` is queued, giving up once the reader is closed."""
+        while not self.stop_event.is_set():
+            try:
+                self.queue.put(value, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the loaded values in order."""
+        while True:
+            value = self.queue.get()
+            if value is _SENTINEL:
+                if self._error is not None:
+                    raise self._error
+                return
+            yield value
+
+    def close(self) -> None:
+        """Stop the reader and wait for it to exit."""
+        self.stop_event.set()
+        self.join()
@@ -1,39 +1,391 @@
+import collections
+import itertools
+import logging
+import mmap
+import multiprocessing
 import os
-import trackers
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
-from trackers.bot_sort import BOTSORT
-from trackers.utils import IterableSimpleNamespace, YAML
+import cv2
+import numpy
+from joblib import Parallel, delayed
 
-tracker_cfg_pathmap = {
-    "botsort": "trackers/cfg/botsort.yaml"
-}
-tracker_classmap = {"botsort": BOTSORT}
+from ._pipeline import PrefetchReader
 
+logger = logging.getLogger(__name__)
 
-def track_objects(datadir: str, tracker_method: str = "botsort") -> None:
+
+def _import_botsort():
+    """Import BOTSORT on first use; the tracker stack pulls in torch and scipy."""
+    from .trackers.bot_sort import BOTSORT
+
+    return BOTSORT
+
+
+_HERE = Path(__file__).parent
+
+tracker_cfg_pathmap = {"botsort": _HERE / "trackers/cfg/botsort.yaml"}
+tracker_classmap = {"botsort": _import_botsort}  # method -> callable returning the tracker class
+
+_IMAGE_BATCH_SIZE = 16  # frames decoded per load_image_batch call
+
+
+class Detections:
+    """
+    Per-frame detection container exposing the attributes expected by `BYTETracker.update`.
+
+    Each row of `data` is one detection in (x1, y1, x2, y2, conf, cls) format, in pixel coordinates.
+
+    Attributes:
+        data (numpy.ndarray): Detections with shape (N, 6).
+
+    Examples:
+        >>> dets = Detections(numpy.array([[10, 20, 50, 80, 0.9, 0]]))
+        >>> dets.xywh
+        array([[30., 50., 40., 60.]], dtype=float32)
+    """
+
+    def __init__(self, data: numpy.ndarray):
+        """Initialize with an (N, 6) array of (x1, y1, x2, y2, conf, cls) detections."""
+        self.data = numpy.asarray(data, dtype=numpy.float32).reshape(-1, 6)
+
+    def __len__(self) -> int:
+        """Return the number of detections."""
+        return len(self.data)
+
+    def __getitem__(self, index) -> "Detections":
+        """Return a new Detections object holding the selected rows."""
+        return Detections(self.data[index])
+
+    @property
+    def xyxy(self) -> numpy.ndarray:
+        """Return the boxes in (x1, y1, x2, y2) format."""
+        return self.data[:, :4]
+
+    @property
+    def xywh(self) -> numpy.ndarray:
+        """Return the boxes in (center x, center y, width, height) format."""
+        xyxy = self.data[:, :4]
+        center, size = (xyxy[:, :2] + xyxy[:, 2:]) / 2, xyxy[:, 2:] - xyxy[:, :2]
+        return numpy.concatenate([center, size], axis=1)
+
+    @property
+    def conf(self) -> numpy.ndarray:
+        """Return the detection confidence scores."""
+        return self.data[:, 4]
+
+    @property
+    def cls(self) -> numpy.ndarray:
+        """Return the detection class ids."""
+        return self.data[:, 5]
+
+
+def _index_detections(det_dir: str) -> dict:
+    """Map each timestamp to its `{ts}.txt` detection file path with a single directory scan."""
+    with os.scandir(det_dir) as entries:
+        return {e.name[:-4]: e.path for e in entries if e.name.endswith(".txt")}
+
+
+def _load_detections(det_path: str | None) -> Detections:
+    """Load (x1, y1, x2, y2, conf, cls) rows from a detection file; None or empty yields none."""
+    lines = []
+    if det_path is not None:
+        with open(det_path, "rb") as file:
+            lines = file.read().split(b"\n")
+    lines = [line for line in lines if line.strip()]
+    if not lines:
+        return Detections(numpy.empty((0, 6), dtype=numpy.float32))
+    return Detections(numpy.loadtxt(lines, dtype=numpy.float32, ndmin=2))
+
+
+def _image_reader(ts_list: list, images_dir: str) -> PrefetchReader:
+    """Prefetch the `{ts}.png` frames of `ts_list` in decode batches; chain it for single frames."""
+    from .trackers.utils.files import load_image_batch
+
+    def load_batch(batch: list) -> list:
+        return load_image_batch([os.path.join(images_dir, f"{ts}.png") for ts in batch])
+
+    step = _IMAGE_BATCH_SIZE
+    batches = [ts_list[i : i + step] for i in range(0, len(ts_list), step)]
+    return PrefetchReader(batches, load_batch, maxsize=2)
+
+
+def _process_window(
+    ts_chunk: list,
+    det_paths: list,
+    images_dir: str,
+    tracker_cfg,
+    tracker_method: str = "botsort",
+    images: PrefetchReader | None = None,
+) -> list:
+    """
+    Track one temporal window of frames with a fresh tracker.
+
+    Args:
+        ts_chunk (list): Timestamps of the frames in this window, in temporal order.
+        det_paths (list): Detection file path of each frame in `ts_chunk`, or None where the frame
+            has no file.
+        images_dir (str): Directory holding one `{ts}.png` image per frame.
+        tracker_cfg (dict): Tracker configuration, turned into a frozen config object inside the
+            worker.
+        tracker_method (str): Key into `tracker_classmap`.
+        images (PrefetchReader, optional): Already running `_image_reader` for `ts_chunk`; created
+            here if None.
+
+    Returns:
+        (list): One (ts, tracks) tuple per frame, where tracks is the array returned by
+            `tracker.update`. Track ids are local to this window.
+    """
+    from .trackers.utils import make_frozen_cfg
+
+    if images is None:
+        images = _image_reader(ts_chunk, images_dir)
+    detections = PrefetchReader(det_paths, _load_detections)
+    tracklets = []
+    try:
+        tracker_cfg = make_frozen_cfg(tracker_cfg, name="TrackerCfg")
+        tracker = tracker_classmap[tracker_method]()(args=tracker_cfg, frame_rate=30)
+        frames = itertools.chain.from_iterable(images)
+        for ts, img, dets in zip(ts_chunk, frames, detections, strict=True):
+            tracklets.append((ts, tracker.update(dets, img)))
+    finally:
+        images.close()
+        detections.close()
+    return tracklets
+
+
+def _draw_frame(img: numpy.ndarray, dets: Detections, tracks: numpy.ndarray) -> numpy.ndarray:
+    """Draw detections in gray and tracks with their ids in a per-id color on a copy of `img`."""
+    canvas = img.copy()
+    for x1, y1, x2, y2 in dets.xyxy.astype(int):
+        cv2.rectangle(canvas, (x1, y1), (x2, y2), (128, 128, 128), 1)
+    for row in tracks:
+        x1, y1, x2, y2 = row[:4].astype(int)
+        track_id = int(row[-4])
+        color = tuple(int(c) for c in numpy.random.default_rng(track_id).integers(64, 256, size=3))
+        cv2.rectangle(canvas, (x1, y1), (x2, y2), color, 2)
+        org = (x1, max(y1 - 4, 0))
+        cv2.putText(canvas, str(track_id), org, cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+    return canvas
+
+
+def _render_frame(
+    img_path: str, det_path: str | None, tracks: numpy.ndarray, out_path: str
+) -> None:
+    """Load one frame and its detections, draw them with `tracks` and write the result."""
+    from .trackers.utils.files import load_image_mmap
+
+    img = load_image_mmap(img_path)
+    if img is None:
+        logger.warning(f"Image not found or unreadable, skipping render: {img_path}")
+        return
+    if not cv2.imwrite(out_path, _draw_frame(img, _load_detections(det_path), tracks)):
+        raise OSError(f"Failed to write image: {out_path}")
+
+
+def _render_tracks(
+    merged: list, det_paths: list, images_dir: str, out_dir: str, workers: int | None = None
+) -> None:
+    """
+    Render detections and tracks of every frame and save them to `out_dir`.
+
+    Frames are independent, so each one is loaded, drawn, encoded and written by `_render_frame` in
+    a pool of worker processes. Only paths and the small track arrays are sent to the workers, and
+    at most two tasks per worker are in flight at a time to bound memory.
+
+    Args:
+        merged (list): Output of `merge_tracklets`.
+        det_paths (list): Detection file path of each frame in `merged`, or None.
+        images_dir (str): Directory holding one `{ts}.png` image per frame.
+        out_dir (str): Directory the rendered frames are written to.
+        workers (int, optional): Number of worker processes; None uses all but one CPU and 0
+            renders inline in the calling process.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    if workers == 0:
+        for (ts, tracks), det_path in zip(merged, det_paths, strict=True):
+            img_path = os.path.join(images_dir, f"{ts}.png")
+            _render_frame(img_path, det_path, tracks, os.path.join(out_dir, f"{ts}.png"))
+        return
+    max_workers = workers or max((os.cpu_count() or 2) - 1, 1)
+    # forkserver avoids copying the parent's tracker state into every worker; fall back where it
+    # is unavailable
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    mp_context = multiprocessing.get_context(method)
+    pending = collections.deque()
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+        for (ts, tracks), det_path in zip(merged, det_paths, strict=True):
+            if len(pending) >= 2 * max_workers:
+                pending.popleft().result()
+            img_path = os.path.join(images_dir, f"{ts}.png")
+            out_path = os.path.join(out_dir, f"{ts}.png")
+            pending.append(executor.submit(_render_frame, img_path, det_path, tracks, out_path))
+        for future in pending:
+            future.result()
+
+
+def _box_iou(boxes_a: numpy.ndarray, boxes_b: numpy.ndarray) -> numpy.ndarray:
+    """Return the (N, M) IoU matrix between two sets of boxes in (x1, y1, x2, y2) format."""
+    lt = numpy.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    rb = numpy.minimum(boxes_a[:, None, 2:4], boxes_b[None, :, 2:4])
+    inter = numpy.prod(numpy.clip(rb - lt, 0, None), axis=2)
+    area_a = numpy.prod(boxes_a[:, 2:4] - boxes_a[:, :2], axis=1)
+    area_b = numpy.prod(boxes_b[:, 2:4] - boxes_b[:, :2], axis=1)
+    return inter / (area_a[:, None] + area_b[None, :] - inter + 1e-7)
+
+
+def merge_tracklets(window_outputs: list, max_cost: float = 0.7) -> list:
+    """
+    Stitch per-window tracklets into globally consistent track ids.
+
+    Only the boundary frames are compared: tracks alive in the last frame of a window are greedily
+    linked, lowest (1 - IoU) cost first, to tracks alive in the first frame of the next window.
+    Unlinked tracks get fresh ids.
+
+    Args:
+        window_outputs (list): Per-window outputs of `_process_window`, in temporal order.
+        max_cost (float): Largest (1 - IoU) cost accepted for a link across a window boundary.
+
+    Returns:
+        (list): One (ts, tracks) tuple per frame with the track id column rewritten to global ids.
+    """
+    merged = []
+    next_id = 1
+    prev_last = None  # tracks of the previous window's last frame, already carrying global ids
+    for window in window_outputs:
+        if not window:
+            continue
+        id_map = {}
+        first = window[0][1]
+        if prev_last is not None and len(prev_last) and len(first):
+            cost = 1 - _box_iou(prev_last[:, :4], first[:, :4])
+            linked = set()
+            order = numpy.unravel_index(numpy.argsort(cost, axis=None), cost.shape)
+            for i, j in zip(*order, strict=True):
+                if cost[i, j] > max_cost:
+                    break
+                global_id, local_id = prev_last[i, -4], first[j, -4]
+                if global_id in linked or local_id in id_map:
+                    continue
+                linked.add(global_id)
+                id_map[local_id] = global_id
+
+        for ts, tracks in window:
+            tracks = tracks.copy()
+            for row in tracks:
+                if row[-4] not in id_map:
+                    id_map[row[-4]] = next_id
+                    next_id += 1
+                row[-4] = id_map[row[-4]]
+            merged.append((ts, tracks))
+        prev_last = merged[-1][1]
+    return merged
+
+
+def track_objects(
+    datadir: str,
+    tracker_method: str = "botsort",
+    window_size: int = 1000,
+    n_jobs: int = 4,
+    render_workers: int | None = None,
+) -> list:
     """
     - load detections from `detections/` directory.
     - load corresponding images from `images/` directory.
     - track detections in next frame.
-    - render both detecctions and tracks in a image and save to visz_objdets_tracks/ dir. 
+    - render both detecctions and tracks in a image and save to visz_objdets_tracks/ dir.
+
+    Tracking runs in two stages: the timestamps are split into near-equal windows of at most
+    `window_size` frames that are tracked concurrently in `n_jobs` worker processes, then
+    `merge_tracklets` links tracks across window boundaries. Within a window, images and detections
+    are prefetched by background threads while the tracker runs; rendering is spread over a pool of
+    `render_workers` worker processes.
+
+    The render pool starts its workers with forkserver or spawn, which re-import the caller's main
+    module, so scripts calling this function must guard the call with
+    `if __name__ == "__main__":`. Pass `render_workers=0` to render inline without a pool.
+
+    Args:
+        datadir (str): Directory holding `images/`, `detections/` and `timestamps.txt`.
+        tracker_method (str): Key into `tracker_classmap` and `tracker_cfg_pathmap`.
+        window_size (int): Largest number of frames tracked by one tracker instance.
+        n_jobs (int): Number of windows tracked concurrently; 1 tracks them sequentially.
+        render_workers (int, optional): Number of render processes; None uses all but one CPU and
+            0 renders inline.
+
+    Returns:
+        (list): One (ts, tracks) tuple per frame with globally consistent track ids.
     """
+    from .trackers.utils import YAML
+
     ts_file_path = os.path.join(datadir, "timestamps.txt")
     det_dir = os.path.join(datadir, "detections")
     images_dir = os.path.join(datadir, "images")
-    if not os.path.exists(ts_file_path):
+    with os.scandir(datadir) as it:  # one listing instead of a stat per expected entry
+        entries = {e.name: e for e in it}
+    if "timestamps.txt" not in entries:
         raise FileNotFoundError(f"Timestamp file not found: {ts_file_path}")
-    if not os.path.exists(det_dir):
+    if "detections" not in entries or not entries["detections"].is_dir():
         raise FileNotFoundError(f"Detections directory not found: {det_dir}")
-    if not os.path.exists(images_dir):
+    if "images" not in entries or not entries["images"].is_dir():
         raise FileNotFoundError(f"Images directory not found: {images_dir}")
-    
-    with open(ts_file_path, 'r') as file:
-        timestamps = [line.strip() for line in file.readlines()]
 
-    tracker_cfg_path = os.path.join(os.path.dirname(__file__), tracker_cfg_pathmap[tracker_method])
-    tracker_cfg = IterableSimpleNamespace(**YAML.load(tracker_cfg_path))
-    tracker = tracker_classmap[tracker_method]((args=tracker_cfg, frame_rate=30)
+    timestamps = []
+    if os.path.getsize(ts_file_path):  # mmap cannot map an empty file
+        with (
+            open(ts_file_path, "rb") as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            # one strip of the whole text drops leading/trailing blank lines; splitlines handles
+            # both LF and CRLF
+            timestamps = mm[:].decode().strip().splitlines()
+
+    tracker_cfg = YAML.load(tracker_cfg_pathmap[tracker_method])
+
+    # list detections once instead of probing the filesystem per frame
+    det_index = _index_detections(det_dir)
+    det_paths = [det_index.get(ts) for ts in timestamps]
 
-    # start processing
-    for ts in timestamps:
-        pass
+    # start processing: ceil(N / window_size) windows of near-equal length, so the last one is
+    # never a short tail
+    n_windows = max(-(-len(timestamps) // window_size), 1)
+    splits = numpy.array_split(numpy.arange(len(timestamps)), n_windows)
+    windows = [(w[0], w[-1] + 1) for w in splits if len(w)]
+    if n_jobs == 1:
+        # sequential windows: start reading the next window's frames while the current one is
+        # tracked; the reader's bounded queue caps how much of it is held in memory
+        window_outputs = []
+        next_images = None
+        if windows:
+            next_images = _image_reader(timestamps[slice(*windows[0])], images_dir)
+        try:
+            for k, (i, j) in enumerate(windows):
+                images = next_images
+                next_images = None
+                if k + 1 < len(windows):
+                    next_images = _image_reader(timestamps[slice(*windows[k + 1])], images_dir)
+                window_outputs.append(
+                    _process_window(
+                        timestamps[i:j],
+                        det_paths[i:j],
+                        images_dir,
+                        tracker_cfg,
+                        tracker_method,
+                        images,
+                    )
+                )
+        finally:
+            if next_images is not None:
+                next_images.close()
+    else:
+        window_outputs = Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(_process_window)(
+                timestamps[i:j], det_paths[i:j], images_dir, tracker_cfg, tracker_method
+            )
+            for i, j in windows
+        )
+    merged = merge_tracklets(window_outputs)
+    out_dir = os.path.join(datadir, "visz_objdets_tracks")
+    _render_tracks(merged, det_paths, images_dir, out_dir, workers=render_workers)
+    return merged
@@ -122,17 +122,26 @@ class BOTrack(STrack):
         return ret
 
     @staticmethod
-    def multi_predict(stracks: List["BOTrack"]) -> None:
-        """Predict the mean and covariance for multiple object tracks using a shared Kalman filter."""
+    def multi_predict(stracks: List["BOTrack"], tmp_buf: Optional[numpy.ndarray] = None) -> None:
+        """
+        Predict the mean and covariance for multiple object tracks using a shared Kalman filter.
+
+        Args:
+            stracks (List[BOTrack]): Tracks to predict, updated in place.
+            tmp_buf (numpy.ndarray, optional): Caller-owned float32 scratch buffer of shape (M, 8, 8) with
+                M >= len(stracks), see `KalmanFilterXYWH.multi_predict_into`. Allocated per call if None.
+        """
         if len(stracks) <= 0:
             return
+        if tmp_buf is None:
+            tmp_buf = numpy.empty((len(stracks), 8, 8), dtype=numpy.float32)
         multi_mean = numpy.asarray([st.mean.copy() for st in stracks])
         multi_covariance = numpy.asarray([st.covariance for st in stracks])
         for i, st in enumerate(stracks):
             if st.state != TrackState.Tracked:
                 multi_mean[i][6] = 0
                 multi_mean[i][7] = 0
-        multi_mean, multi_covariance = BOTrack.shared_kalman.multi_predict(multi_mean, multi_covariance)
+        BOTrack.shared_kalman.multi_predict_into(multi_mean, multi_covariance, tmp_buf)
         for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
             stracks[i].mean = mean
             stracks[i].covariance = cov
@@ -203,6 +212,7 @@ class BOTSORT(BYTETracker):
             if args.with_reid
             else None
         )
+        self._det_feats = (None, None)  # (detections, their (N, D) feature pool) from the latest `init_track`
 
     def get_kalmanfilter(self) -> KalmanFilterXYWH:
         """Return an instance of KalmanFilterXYWH for predicting and updating object states in the tracking process."""
@@ -215,8 +225,13 @@ class BOTSORT(BYTETracker):
         bboxes = results.xywhr if hasattr(results, "xywhr") else results.xywh
         bboxes = numpy.concatenate([bboxes, numpy.arange(len(bboxes)).reshape(-1, 1)], axis=-1)
         if self.args.with_reid and self.encoder is not None:
-            features_keep = self.encoder(img, bboxes)
-            return [BOTrack(xywh, s, c, f) for (xywh, s, c, f) in zip(bboxes, results.conf, results.cls, features_keep)]
+            # One contiguous (N, D) pool per frame; each detection keeps a row view, normalized in place by BOTrack
+            features_keep = numpy.stack(self.encoder(img, bboxes)).astype(numpy.float32, copy=False)
+            detections = [
+                BOTrack(xywh, s, c, f) for (xywh, s, c, f) in zip(bboxes, results.conf, results.cls, features_keep)
+            ]
+            self._det_feats = (detections, features_keep)
+            return detections
         else:
             return [BOTrack(xywh, s, c) for (xywh, s, c) in zip(bboxes, results.conf, results.cls)]
 
@@ -229,7 +244,9 @@ class BOTSORT(BYTETracker):
             dists = matching.fuse_score(dists, detections)
 
         if self.args.with_reid and self.encoder is not None:
-            emb_dists = matching.embedding_distance(tracks, detections) / 2.0
+            pooled_dets, det_feats = self._det_feats
+            det_feats = det_feats if pooled_dets is detections else None  # the pool only matches the full list
+            emb_dists = matching.embedding_distance(tracks, detections, det_feats=det_feats) / 2.0
             emb_dists[emb_dists > (1 - self.appearance_thresh)] = 1.0
             emb_dists[dists_mask] = 1.0
             dists = numpy.minimum(dists, emb_dists)
@@ -237,12 +254,13 @@ class BOTSORT(BYTETracker):
 
     def multi_predict(self, tracks: List[BOTrack]) -> None:
         """Predict the mean and covariance of multiple object tracks using a shared Kalman filter."""
-        BOTrack.multi_predict(tracks)
+        BOTrack.multi_predict(tracks, self.predict_buf(len(tracks)))
 
     def reset(self) -> None:
         """Reset the BOTSORT tracker to its initial state, clearing all tracked objects and internal states."""
         super().reset()
         self.gmc.reset_params()
+        self._det_feats = (None, None)
 
 
 class ReID:
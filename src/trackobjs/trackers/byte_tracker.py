@@ -37,6 +37,7 @@ class STrack(BaseTrack):
         predict: Predict the next state of the object using Kalman filter.
         multi_predict: Predict the next states for multiple tracks.
         multi_gmc: Update multiple track states using a homography matrix.
+        multi_activate: Activate multiple new tracklets with one batched Kalman initiation.
         activate: Activate a new tracklet.
         re_activate: Reactivate a previously lost tracklet.
         update: Update the state of a matched track.
@@ -73,6 +74,7 @@ class STrack(BaseTrack):
         self._tlwh = numpy.asarray(xywh2ltwh(xywh[:4]), dtype=numpy.float32)
         self.kalman_filter = None
         self.mean, self.covariance = None, None
+        self._box, self._box_mean = None, None  # cached `iou_box` and the `mean` it was computed from
         self.is_activated = False
 
         self.score = score
@@ -89,16 +91,25 @@ class STrack(BaseTrack):
         self.mean, self.covariance = self.kalman_filter.predict(mean_state, self.covariance)
 
     @staticmethod
-    def multi_predict(stracks: List["STrack"]):
-        """Perform multi-object predictive tracking using Kalman filter for the provided list of STrack instances."""
+    def multi_predict(stracks: List["STrack"], tmp_buf: Optional[numpy.ndarray] = None):
+        """
+        Perform multi-object predictive tracking using Kalman filter for the provided list of STrack instances.
+
+        Args:
+            stracks (List[STrack]): Tracks to predict, updated in place.
+            tmp_buf (numpy.ndarray, optional): Caller-owned float32 scratch buffer of shape (M, 8, 8) with
+                M >= len(stracks), see `KalmanFilterXYAH.multi_predict_into`. Allocated per call if None.
+        """
         if len(stracks) <= 0:
             return
+        if tmp_buf is None:
+            tmp_buf = numpy.empty((len(stracks), 8, 8), dtype=numpy.float32)
         multi_mean = numpy.asarray([st.mean.copy() for st in stracks])
         multi_covariance = numpy.asarray([st.covariance for st in stracks])
         for i, st in enumerate(stracks):
             if st.state != TrackState.Tracked:
                 multi_mean[i][7] = 0
-        multi_mean, multi_covariance = STrack.shared_kalman.multi_predict(multi_mean, multi_covariance)
+        STrack.shared_kalman.multi_predict_into(multi_mean, multi_covariance, tmp_buf)
         for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
             stracks[i].mean = mean
             stracks[i].covariance = cov
@@ -110,9 +121,9 @@ class STrack(BaseTrack):
             multi_mean = numpy.asarray([st.mean.copy() for st in stracks])
             multi_covariance = numpy.asarray([st.covariance for st in stracks])
 
-            R = H[:2, :2]
-            R8x8 = numpy.kron(numpy.eye(4, dtype=float), R)
-            t = H[:2, 2]
+            R = H[:2, :2].astype(numpy.float32)
+            R8x8 = numpy.kron(numpy.eye(4, dtype=numpy.float32), R)  # keep the float32 Kalman state in float32
+            t = H[:2, 2].astype(numpy.float32)
 
             for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
                 mean = R8x8.dot(mean)
@@ -122,11 +133,28 @@ class STrack(BaseTrack):
                 stracks[i].mean = mean
                 stracks[i].covariance = cov
 
+    @staticmethod
+    def multi_activate(stracks: List["STrack"], kalman_filter: KalmanFilterXYAH, frame_id: int):
+        """Activate several new tracklets at once, initializing all their states with one batched Kalman call."""
+        if len(stracks) <= 0:
+            return
+        measurements = numpy.asarray([st.convert_coords(st._tlwh) for st in stracks])
+        multi_mean, multi_covariance = kalman_filter.initiate_batch(measurements)
+        for st, mean, cov in zip(stracks, multi_mean, multi_covariance, strict=True):
+            st._activate_state(kalman_filter, frame_id, mean, cov)
+
     def activate(self, kalman_filter: KalmanFilterXYAH, frame_id: int):
         """Activate a new tracklet using the provided Kalman filter and initialize its state and covariance."""
+        mean, covariance = kalman_filter.initiate(self.convert_coords(self._tlwh))
+        self._activate_state(kalman_filter, frame_id, mean, covariance)
+
+    def _activate_state(
+        self, kalman_filter: KalmanFilterXYAH, frame_id: int, mean: numpy.ndarray, covariance: numpy.ndarray
+    ):
+        """Assign a new track ID and the initial Kalman state, and mark the tracklet as tracked from `frame_id`."""
         self.kalman_filter = kalman_filter
         self.track_id = self.next_id()
-        self.mean, self.covariance = self.kalman_filter.initiate(self.convert_coords(self._tlwh))
+        self.mean, self.covariance = mean, covariance
 
         self.tracklet_len = 0
         self.state = TrackState.Tracked
@@ -224,6 +252,19 @@ class STrack(BaseTrack):
             return self.xywh
         return numpy.concatenate([self.xywh, self.angle[None]])
 
+    @property
+    def iou_box(self) -> numpy.ndarray:
+        """
+        Get the box used for IoU matching, `xywha` for oriented boxes and `xyxy` otherwise.
+
+        The box is cached and recomputed only once `mean` has been reassigned, which every Kalman step and GMC
+        update does, so repeated cost-matrix builds within a frame skip the property chain. Do not modify it in place.
+        """
+        if self._box is None or self._box_mean is not self.mean:
+            self._box = self.xywha if self.angle is not None else self.xyxy
+            self._box_mean = self.mean
+        return self._box
+
     @property
     def result(self) -> List[float]:
         """Get the current tracking results in the appropriate bounding box format."""
@@ -292,6 +333,7 @@ class BYTETracker:
         self.args = args
         self.max_time_lost = int(frame_rate / 30.0 * args.track_buffer)
         self.kalman_filter = self.get_kalmanfilter()
+        self._predict_buf = numpy.empty((0, 8, 8), dtype=numpy.float32)  # reused by `multi_predict` across frames
         self.reset_id()
 
     def update(self, results, img: Optional[numpy.ndarray] = None, feats: Optional[numpy.ndarray] = None) -> numpy.ndarray:
@@ -382,12 +424,9 @@ class BYTETracker:
             track.mark_removed()
             removed_stracks.append(track)
         # Step 4: Init new stracks
-        for inew in u_detection:
-            track = detections[inew]
-            if track.score < self.args.new_track_thresh:
-                continue
-            track.activate(self.kalman_filter, self.frame_id)
-            activated_stracks.append(track)
+        new_stracks = [detections[inew] for inew in u_detection if detections[inew].score >= self.args.new_track_thresh]
+        STrack.multi_activate(new_stracks, self.kalman_filter, self.frame_id)
+        activated_stracks.extend(new_stracks)
         # Step 5: Update state
         for track in self.lost_stracks:
             if self.frame_id - track.end_frame > self.max_time_lost:
@@ -428,7 +467,14 @@ class BYTETracker:
 
     def multi_predict(self, tracks: List[STrack]):
         """Predict the next states for multiple tracks using Kalman filter."""
-        STrack.multi_predict(tracks)
+        STrack.multi_predict(tracks, self.predict_buf(len(tracks)))
+
+    def predict_buf(self, n: int) -> numpy.ndarray:
+        """Return this tracker's float32 scratch buffer of at least `n` 8x8 matrices, grown as needed."""
+        size = len(self._predict_buf)
+        if size < n:
+            self._predict_buf = numpy.empty((max(n, 2 * size), 8, 8), dtype=numpy.float32)
+        return self._predict_buf
 
     @staticmethod
     def reset_id():
@@ -1,13 +1,35 @@
+import functools
+import re
+from dataclasses import fields, make_dataclass
 from types import SimpleNamespace
 from pathlib import Path
 
+import yaml as _YAML_MOD
+
 import logging
 logger = logging.getLogger(__name__)
 
+# Use C-based implementation if available for better performance
+try:
+    _SAFE_LOADER = _YAML_MOD.CSafeLoader
+    _SAFE_DUMPER = _YAML_MOD.CSafeDumper
+except AttributeError:
+    _SAFE_LOADER = _YAML_MOD.SafeLoader
+    _SAFE_DUMPER = _YAML_MOD.SafeDumper
+
+# Characters PyYAML refuses to load, stripped by the YAML.load fallback path
+_YAML_SANITIZE_RE = re.compile(r"[^\x09\x0A\x0D\x20-\x7E\x85\xA0-\uD7FF\uE000-\uFFFD\U00010000-\U0010ffff]+")
+
 
 FILE = Path(__file__).resolve()
 ROOT = FILE.parents[1]
 DEFAULT_CFG_PATH = ROOT / "cfg/default.yaml"
+_CFG_ATTR_ERROR = (
+    "'{name}' object has no attribute '{attr}'. This may be caused by a modified or out of date ultralytics "
+    "'default.yaml' file.\nPlease update your code with 'pip install -U ultralytics' and if necessary replace "
+    f"{DEFAULT_CFG_PATH} with the latest version from "
+    "https://github.com/ultralytics/ultralytics/blob/main/ultralytics/cfg/default.yaml"
+)
 
 
 class IterableSimpleNamespace(SimpleNamespace):
@@ -19,7 +41,7 @@ class IterableSimpleNamespace(SimpleNamespace):
     configuration parameters.
 
     Methods:
-        __iter__: Return an iterator of key-value pairs from the namespace's attributes.
+        __iter__: Return an iterator of key-value pairs from the namespace's attributes, cached until modified.
         __str__: Return a human-readable string representation of the object.
         __getattr__: Provide a custom attribute access error message with helpful information.
         get: Retrieve the value of a specified key, or a default value if the key doesn't exist.
@@ -45,9 +67,28 @@ class IterableSimpleNamespace(SimpleNamespace):
         and iterable format compared to a standard dictionary.
     """
 
+    __slots__ = ("_items",)  # cached attribute items, kept out of the namespace's __dict__
+
+    def __init__(self, **kwargs):
+        """Initialize the namespace with the given attributes and an empty iteration cache."""
+        super().__init__(**kwargs)
+        object.__setattr__(self, "_items", None)
+
     def __iter__(self):
         """Return an iterator of key-value pairs from the namespace's attributes."""
-        return iter(vars(self).items())
+        if self._items is None:  # built on first iteration, reused until an attribute changes
+            object.__setattr__(self, "_items", tuple(vars(self).items()))
+        return iter(self._items)
+
+    def __setattr__(self, attr, value):
+        """Set an attribute and invalidate the cached items."""
+        super().__setattr__(attr, value)
+        object.__setattr__(self, "_items", None)
+
+    def __delattr__(self, attr):
+        """Delete an attribute and invalidate the cached items."""
+        super().__delattr__(attr)
+        object.__setattr__(self, "_items", None)
 
     def __str__(self):
         """Return a human-readable string representation of the object."""
@@ -55,20 +96,102 @@ class IterableSimpleNamespace(SimpleNamespace):
 
     def __getattr__(self, attr):
         """Provide a custom attribute access error message with helpful information."""
-        name = self.__class__.__name__
-        raise AttributeError(
-            f"""
-            '{name}' object has no attribute '{attr}'. This may be caused by a modified or out of date ultralytics
-            'default.yaml' file.\nPlease update your code with 'pip install -U ultralytics' and if necessary replace
-            {DEFAULT_CFG_PATH} with the latest version from
-            https://github.com/ultralytics/ultralytics/blob/main/ultralytics/cfg/default.yaml
-            """
-        )
+        raise AttributeError(_CFG_ATTR_ERROR.format(name=self.__class__.__name__, attr=attr))
 
     def get(self, key, default=None):
         """Return the value of the specified key if it exists; otherwise, return the default value."""
         return getattr(self, key, default)
-    
+
+
+def _frozen_cfg_iter(self):
+    """Return an iterator of key-value pairs from the config's fields."""
+    return ((f.name, getattr(self, f.name)) for f in fields(self))
+
+
+def _frozen_cfg_str(self):
+    """Return a human-readable string representation of the config."""
+    return "\n".join(f"{k}={v}" for k, v in self)
+
+
+def _frozen_cfg_getattr(self, attr):
+    """Provide a custom attribute access error message with helpful information."""
+    raise AttributeError(_CFG_ATTR_ERROR.format(name=self.__class__.__name__, attr=attr))
+
+
+def _frozen_cfg_get(self, key, default=None):
+    """Return the value of the specified key if it exists; otherwise, return the default value."""
+    return getattr(self, key, default)
+
+
+def make_frozen_cfg(cfg: dict, name: str = "FrozenCfg"):
+    """
+    Build a frozen, slotted dataclass instance holding the given configuration.
+
+    The dataclass is generated from the keys of `cfg`, so attribute reads are slot loads instead of the instance
+    `__dict__` lookups of `IterableSimpleNamespace`, which matters for configs read in per-frame tracker code. The
+    instance offers the same `__iter__`, `__str__`, `get` and attribute-error message as `IterableSimpleNamespace`, but
+    cannot be modified after creation.
+
+    Args:
+        cfg (dict): Configuration mapping, e.g. as returned by `YAML.load`. Keys must be valid Python identifiers.
+        name (str): Name of the generated dataclass.
+
+    Returns:
+        (object): Instance of the generated dataclass with one field per key of `cfg`.
+
+    Examples:
+        >>> cfg = make_frozen_cfg({"a": 1, "b": 2}, name="TrackerCfg")
+        >>> cfg.a
+        1
+        >>> dict(cfg)
+        {'a': 1, 'b': 2}
+        >>> cfg.get("c", "default")
+        'default'
+    """
+    cls = make_dataclass(
+        name,
+        [(k, type(v)) for k, v in cfg.items()],
+        namespace={
+            "__iter__": _frozen_cfg_iter,
+            "__str__": _frozen_cfg_str,
+            "__getattr__": _frozen_cfg_getattr,
+            "get": _frozen_cfg_get,
+        },
+        frozen=True,
+        slots=True,
+    )
+    return cls(**cfg)
+
+
+_ANSI_COLORS = {
+    "black": "\033[30m",  # basic colors
+    "red": "\033[31m",
+    "green": "\033[32m",
+    "yellow": "\033[33m",
+    "blue": "\033[34m",
+    "magenta": "\033[35m",
+    "cyan": "\033[36m",
+    "white": "\033[37m",
+    "bright_black": "\033[90m",  # bright colors
+    "bright_red": "\033[91m",
+    "bright_green": "\033[92m",
+    "bright_yellow": "\033[93m",
+    "bright_blue": "\033[94m",
+    "bright_magenta": "\033[95m",
+    "bright_cyan": "\033[96m",
+    "bright_white": "\033[97m",
+    "end": "\033[0m",  # misc
+    "bold": "\033[1m",
+    "underline": "\033[4m",
+}
+_ANSI_END = _ANSI_COLORS["end"]
+
+
+@functools.lru_cache(maxsize=256)
+def _ansi_prefix(*args):
+    """Return the concatenated ANSI escape codes for the given color and style names."""
+    return "".join(_ANSI_COLORS[x] for x in args)
+
 
 def colorstr(*input):
     r"""
@@ -102,28 +225,7 @@ def colorstr(*input):
         https://en.wikipedia.org/wiki/ANSI_escape_code
     """
     *args, string = input if len(input) > 1 else ("blue", "bold", input[0])  # color arguments, string
-    colors = {
-        "black": "\033[30m",  # basic colors
-        "red": "\033[31m",
-        "green": "\033[32m",
-        "yellow": "\033[33m",
-        "blue": "\033[34m",
-        "magenta": "\033[35m",
-        "cyan": "\033[36m",
-        "white": "\033[37m",
-        "bright_black": "\033[90m",  # bright colors
-        "bright_red": "\033[91m",
-        "bright_green": "\033[92m",
-        "bright_yellow": "\033[93m",
-        "bright_blue": "\033[94m",
-        "bright_magenta": "\033[95m",
-        "bright_cyan": "\033[96m",
-        "bright_white": "\033[97m",
-        "end": "\033[0m",  # misc
-        "bold": "\033[1m",
-        "underline": "\033[4m",
-    }
-    return "".join(colors[x] for x in args) + f"{string}" + colors["end"]
+    return _ansi_prefix(*args) + f"{string}" + _ANSI_END
 
 
 class YAML:
@@ -131,22 +233,15 @@ class YAML:
     YAML utility class for efficient file operations with automatic C-implementation detection.
 
     This class provides optimized YAML loading and saving operations using PyYAML's fastest available implementation
-    (C-based when possible). It implements a singleton pattern with lazy initialization, allowing direct class method
-    usage without explicit instantiation. The class handles file path creation, validation, and character encoding
+    (C-based when possible). The loader and dumper are selected once at module import and used directly by the class
+    methods, so no instantiation is needed. The class handles file path creation, validation, and character encoding
     issues automatically.
 
     The implementation prioritizes performance through:
         - Automatic C-based loader/dumper selection when available
-        - Singleton pattern to reuse the same instance
-        - Lazy initialization to defer import costs until needed
+        - Module-level loader/dumper bound once at import, with no per-call dispatch
         - Fallback mechanisms for handling problematic YAML content
 
-    Attributes:
-        _instance: Internal singleton instance storage.
-        yaml: Reference to the PyYAML module.
-        SafeLoader: Best available YAML loader (CSafeLoader if available).
-        SafeDumper: Best available YAML dumper (CSafeDumper if available).
-
     Examples:
         >>> data = YAML.load("config.yaml")
         >>> data["new_value"] = 123
@@ -154,28 +249,6 @@ class YAML:
         >>> YAML.print(data)
     """
 
-    _instance = None
-
-    @classmethod
-    def _get_instance(cls):
-        """Initialize singleton instance on first use."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
-
-    def __init__(self):
-        """Initialize with optimal YAML implementation (C-based when available)."""
-        import yaml
-
-        self.yaml = yaml
-        # Use C-based implementation if available for better performance
-        try:
-            self.SafeLoader = yaml.CSafeLoader
-            self.SafeDumper = yaml.CSafeDumper
-        except (AttributeError, ImportError):
-            self.SafeLoader = yaml.SafeLoader
-            self.SafeDumper = yaml.SafeDumper
-
     @classmethod
     def save(cls, file="data.yaml", data=None, header=""):
         """
@@ -186,7 +259,6 @@ class YAML:
             data (dict | None): Dict or compatible object to save.
             header (str): Optional string to add at file beginning.
         """
-        instance = cls._get_instance()
         if data is None:
             data = {}
 
@@ -204,7 +276,7 @@ class YAML:
         with open(file, "w", errors="ignore", encoding="utf-8") as f:
             if header:
                 f.write(header)
-            instance.yaml.dump(data, f, sort_keys=False, allow_unicode=True, Dumper=instance.SafeDumper)
+            _YAML_MOD.dump(data, f, sort_keys=False, allow_unicode=True, Dumper=_SAFE_DUMPER)
 
     @classmethod
     def load(cls, file="data.yaml", append_filename=False):
@@ -218,24 +290,24 @@ class YAML:
         Returns:
             (dict): Loaded YAML content.
         """
-        instance = cls._get_instance()
         assert str(file).endswith((".yaml", ".yml")), f"Not a YAML file: {file}"
 
-        # Read file content
-        with open(file, errors="ignore", encoding="utf-8") as f:
+        # Read raw bytes and let the (C) loader decode them, skipping a Python-level decode of the whole file
+        with open(file, "rb") as f:
             s = f.read()
 
         # Try loading YAML with fallback for problematic characters
         try:
-            data = instance.yaml.load(s, Loader=instance.SafeLoader) or {}
+            data = _YAML_MOD.load(s, Loader=_SAFE_LOADER) or {}
         except Exception:
-            # Remove problematic characters and retry
-            s = re.sub(r"[^\x09\x0A\x0D\x20-\x7E\x85\xA0-\uD7FF\uE000-\uFFFD\U00010000-\U0010ffff]+", "", s)
-            data = instance.yaml.load(s, Loader=instance.SafeLoader) or {}
+            # Drop invalid UTF-8, remove problematic characters and retry
+            s = _YAML_SANITIZE_RE.sub("", s.decode("utf-8", errors="ignore"))
+            data = _YAML_MOD.load(s, Loader=_SAFE_LOADER) or {}
 
         # Check for accidental user-error None strings (should be 'null' in YAML)
-        if "None" in data.values():
-            data = {k: None if v == "None" else v for k, v in data.items()}
+        for k, v in data.items():
+            if v == "None":
+                data[k] = None  # replacing values in place is safe while iterating
 
         if append_filename:
             data["yaml_file"] = str(file)
@@ -249,12 +321,10 @@ class YAML:
         Args:
             yaml_file (str | Path | dict): Path to YAML file or dict to print.
         """
-        instance = cls._get_instance()
-
         # Load file if path provided
         yaml_dict = cls.load(yaml_file) if isinstance(yaml_file, (str, Path)) else yaml_file
 
         # Use -1 for unlimited width in C implementation
-        dump = instance.yaml.dump(yaml_dict, sort_keys=False, allow_unicode=True, width=-1, Dumper=instance.SafeDumper)
+        dump = _YAML_MOD.dump(yaml_dict, sort_keys=False, allow_unicode=True, width=-1, Dumper=_SAFE_DUMPER)
 
         logger.info(f"Printing '{colorstr('bold', 'black', yaml_file)}'\n\n{dump}")
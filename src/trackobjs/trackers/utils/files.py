@@ -1,6 +1,15 @@
 from pathlib import Path
-from typing import Union
-import os.path
+from typing import List, Optional, Tuple, Union
+import mmap
+import os
+
+import cv2
+import numpy
+
+import logging
+logger = logging.getLogger(__name__)
+
+_spdl_fallback_warned = False  # `load_image_batch` warns on the first SPDL failure only
 
 
 def increment_path(path: Union[str, Path], exist_ok: bool = False, sep: str = "", mkdir: bool = False) -> Path:
@@ -9,7 +18,8 @@ def increment_path(path: Union[str, Path], exist_ok: bool = False, sep: str = ""
 
     If the path exists and `exist_ok` is not True, the path will be incremented by appending a number and `sep` to
     the end of the path. If the path is a file, the file extension will be preserved. If the path is a directory, the
-    number will be appended directly to the end of the path.
+    number will be appended directly to the end of the path. Existing numbered paths are assumed to form a contiguous
+    run (2, 3, ..., n), which lets the next free number be found with O(log n) filesystem probes.
 
     Args:
         path (str | Path): Path to increment.
@@ -38,14 +48,102 @@ def increment_path(path: Union[str, Path], exist_ok: bool = False, sep: str = ""
     if path.exists() and not exist_ok:
         path, suffix = (path.with_suffix(""), path.suffix) if path.is_file() else (path, "")
 
-        # Method 1
-        for n in range(2, 9999):
-            p = f"{path}{sep}{n}{suffix}"  # increment path
-            if not os.path.exists(p):
-                break
-        path = Path(p)
+        # Exponential probe for a free number, then binary search the gap (assumes runs are numbered contiguously)
+        stem = str(path)
+        lo, hi = 1, 2  # lo: known taken (the unnumbered path), hi: candidate
+        while os.path.lexists(f"{stem}{sep}{hi}{suffix}"):
+            lo, hi = hi, hi * 2
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if os.path.lexists(f"{stem}{sep}{mid}{suffix}"):
+                lo = mid
+            else:
+                hi = mid
+        path = Path(f"{stem}{sep}{hi}{suffix}")  # increment path
 
     if mkdir:
         path.mkdir(parents=True, exist_ok=True)  # make directory
 
     return path
+
+
+def load_image_mmap(path: Union[str, Path], shape: Optional[Tuple[int, ...]] = None) -> Optional[numpy.ndarray]:
+    """
+    Load an image through a read-only memory map of the file instead of a buffered read.
+
+    Encoded images (png, jpg, ...) are decoded straight from the mapped pages with `cv2.imdecode`. Raw frames are
+    returned as a read-only, zero-copy uint8 view of the mapping reshaped to `shape`; the mapping lives as long as
+    the view.
+
+    Args:
+        path (str | Path): Path to the image file.
+        shape (tuple, optional): Frame shape, e.g. (H, W, 3), of a raw uint8 frame. If None, the file is decoded.
+
+    Returns:
+        (numpy.ndarray | None): The BGR image, or None if the file is missing, unreadable, not a regular file,
+            empty or cannot be decoded, matching `cv2.imread`.
+
+    Examples:
+        >>> img = load_image_mmap("images/0001.png")
+        >>> raw = load_image_mmap("frames/0001.raw", shape=(480, 640, 3))
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:  # missing, not readable, ...
+        return None
+    try:
+        if os.fstat(fd).st_size == 0:  # mmap cannot map an empty file
+            return None
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except OSError:  # not a regular file, e.g. a directory
+        return None
+    finally:
+        os.close(fd)  # the mapping keeps its own reference to the file
+
+    if shape is not None:
+        return numpy.frombuffer(mm, dtype=numpy.uint8).reshape(shape)
+    buf = numpy.frombuffer(mm, dtype=numpy.uint8)
+    img = cv2.imdecode(buf, cv2.IMREAD_COLOR)
+    del buf  # release the buffer export so the mapping can be closed
+    mm.close()
+    return img
+
+
+def load_image_batch(paths: List[Union[str, Path]]) -> List[Optional[numpy.ndarray]]:
+    """
+    Decode a batch of images, using SPDL's thread-pooled batch decoder when it is installed.
+
+    SPDL decodes the whole batch in native threads without holding the GIL, but resizes every frame to one output size.
+    The first frame is therefore decoded with `load_image_mmap` to get the sequence's frame size, and the rest of the
+    batch is decoded by SPDL at that size. If SPDL is not installed or fails to decode the batch (e.g. a missing file),
+    every frame is loaded with `load_image_mmap` instead; the first such failure is logged as a warning.
+
+    Args:
+        paths (List[str | Path]): Paths to the images of one sequence, all sharing the same frame size.
+
+    Returns:
+        (List[numpy.ndarray | None]): The BGR images in `paths` order, None for frames that cannot be loaded.
+
+    Examples:
+        >>> imgs = load_image_batch(["images/0001.png", "images/0002.png"])
+    """
+    try:
+        import spdl.io
+    except ImportError:
+        return [load_image_mmap(p) for p in paths]
+
+    if not paths:
+        return []
+    first = load_image_mmap(paths[0])
+    if first is None or len(paths) == 1:
+        return [first] + [load_image_mmap(p) for p in paths[1:]]
+    height, width = first.shape[:2]
+    try:
+        buffer = spdl.io.load_image_batch([str(p) for p in paths[1:]], width=width, height=height, pix_fmt="bgr24")
+        return [first, *spdl.io.to_numpy(buffer)]
+    except (RuntimeError, OSError, ValueError) as e:  # decode / IO errors; API misuse still raises
+        global _spdl_fallback_warned
+        if not _spdl_fallback_warned:
+            _spdl_fallback_warned = True
+            logger.warning(f"SPDL batch decode failed, falling back to per-frame decoding: {e}")
+        return [first] + [load_image_mmap(p) for p in paths[1:]]
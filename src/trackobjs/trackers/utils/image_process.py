@@ -1,7 +1,7 @@
 from pathlib import Path
 import torch
 
-import ops
+from . import ops
 from .files import increment_path
 from PIL import Image
 
@@ -1,6 +1,167 @@
+from typing import Optional
+
 import numpy
 import scipy.linalg
 
+try:
+    import numba
+except ImportError:  # numba is optional; without it the NumPy/SciPy code paths are used
+    numba = None
+
+
+# 0.95 quantile of the chi-square distribution with N degrees of freedom (N = 1..9), the usual Mahalanobis gate
+chi2inv95 = {1: 3.8415, 2: 5.9915, 3: 7.8147, 4: 9.4877, 5: 11.070, 6: 12.592, 7: 14.067, 8: 15.507, 9: 16.919}
+
+
+def _njit(fn):
+    """Compile `fn` in nopython mode when numba is installed, otherwise return None so callers fall back to NumPy."""
+    return numba.njit(cache=True, fastmath=True)(fn) if numba is not None else None
+
+
+# The kernels below work on the fixed 8-dim state / 4-dim measurement with literal loop bounds, so LLVM can fully unroll
+# them; for matrices this small, NumPy's per-call dispatch and temporaries cost far more than the arithmetic.
+
+
+@_njit
+def _kf_predict_njit(mean, covariance, motion_mat, motion_var):
+    """Return `motion_mat @ mean` and `motion_mat @ covariance @ motion_mat.T + diag(motion_var)`."""
+    new_mean = numpy.empty(8, motion_mat.dtype)
+    tmp = numpy.empty((8, 8), motion_mat.dtype)
+    new_cov = numpy.empty((8, 8), motion_mat.dtype)
+    for i in range(8):
+        acc = 0.0
+        for k in range(8):
+            acc += motion_mat[i, k] * mean[k]
+        new_mean[i] = acc
+    for i in range(8):
+        for j in range(8):
+            acc = 0.0
+            for k in range(8):
+                acc += motion_mat[i, k] * covariance[k, j]
+            tmp[i, j] = acc
+    for i in range(8):
+        for j in range(8):
+            acc = 0.0
+            for k in range(8):
+                acc += tmp[i, k] * motion_mat[j, k]
+            new_cov[i, j] = acc
+        new_cov[i, i] += motion_var[i]
+    return new_mean, new_cov
+
+
+@_njit
+def _kf_project_njit(mean, covariance, update_mat, innovation_var):
+    """Return `update_mat @ mean` and `update_mat @ covariance @ update_mat.T + diag(innovation_var)`."""
+    new_mean = numpy.empty(4, update_mat.dtype)
+    tmp = numpy.empty((4, 8), update_mat.dtype)
+    new_cov = numpy.empty((4, 4), update_mat.dtype)
+    for i in range(4):
+        acc = 0.0
+        for k in range(8):
+            acc += update_mat[i, k] * mean[k]
+        new_mean[i] = acc
+    for i in range(4):
+        for j in range(8):
+            acc = 0.0
+            for k in range(8):
+                acc += update_mat[i, k] * covariance[k, j]
+            tmp[i, j] = acc
+    for i in range(4):
+        for j in range(4):
+            acc = 0.0
+            for k in range(8):
+                acc += tmp[i, k] * update_mat[j, k]
+            new_cov[i, j] = acc
+        new_cov[i, i] += innovation_var[i]
+    return new_mean, new_cov
+
+
+@_njit
+def _chol4(a):
+    """Return the lower Cholesky factor of a symmetric positive-definite 4x4 matrix; raise LinAlgError otherwise."""
+    chol = numpy.zeros((4, 4), a.dtype)
+    for j in range(4):
+        acc = a[j, j]
+        for k in range(j):
+            acc -= chol[j, k] * chol[j, k]
+        if not acc > 0.0:  # not positive definite; same error as scipy.linalg.cho_factor
+            raise numpy.linalg.LinAlgError("Matrix is not positive definite")
+        chol[j, j] = numpy.sqrt(acc)
+        for i in range(j + 1, 4):
+            acc = a[i, j]
+            for k in range(j):
+                acc -= chol[i, k] * chol[j, k]
+            chol[i, j] = acc / chol[j, j]
+    return chol
+
+
+@_njit
+def _chol_solve4(chol, b):
+    """Solve `(chol @ chol.T) @ x = b` for `b` of shape (4, k) by forward then back substitution."""
+    x = b.copy()
+    for c in range(x.shape[1]):
+        for i in range(4):
+            acc = x[i, c]
+            for k in range(i):
+                acc -= chol[i, k] * x[k, c]
+            x[i, c] = acc / chol[i, i]
+        for i in range(3, -1, -1):
+            acc = x[i, c]
+            for k in range(i + 1, 4):
+                acc -= chol[k, i] * x[k, c]
+            x[i, c] = acc / chol[i, i]
+    return x
+
+
+@_njit
+def _kf_update_njit(mean, covariance, projected_mean, projected_cov, measurement, update_mat):
+    """Return the corrected mean and covariance given the projected state and a 4-dim measurement."""
+    # covariance @ update_mat.T, (8, 4)
+    pht = numpy.empty((8, 4), update_mat.dtype)
+    for i in range(8):
+        for j in range(4):
+            acc = 0.0
+            for k in range(8):
+                acc += covariance[i, k] * update_mat[j, k]
+            pht[i, j] = acc
+    # kalman_gain.T = projected_cov^-1 @ pht.T, (4, 8)
+    gain_t = _chol_solve4(_chol4(projected_cov), pht.T.copy())
+
+    new_mean = numpy.empty(8, update_mat.dtype)
+    for i in range(8):
+        acc = 0.0
+        for k in range(4):
+            acc += gain_t[k, i] * (measurement[k] - projected_mean[k])
+        new_mean[i] = mean[i] + acc
+    # covariance - kalman_gain @ projected_cov @ kalman_gain.T, where projected_cov @ kalman_gain.T == pht.T
+    new_cov = numpy.empty((8, 8), update_mat.dtype)
+    for i in range(8):
+        for j in range(8):
+            acc = 0.0
+            for k in range(4):
+                acc += gain_t[k, i] * pht[j, k]
+            new_cov[i, j] = covariance[i, j] - acc
+    return new_mean, new_cov
+
+
+@_njit
+def _batch_maha_njit(chol, d):
+    """Return the (T, N) squared norms of `z` solving `chol[t] @ z = d[t, n]` by forward substitution."""
+    n_tracks, n_meas, k = d.shape
+    out = numpy.empty((n_tracks, n_meas), d.dtype)
+    z = numpy.empty(k, d.dtype)
+    for t in range(n_tracks):
+        for n in range(n_meas):
+            acc_sq = 0.0
+            for i in range(k):
+                acc = d[t, n, i]
+                for j in range(i):
+                    acc -= chol[t, i, j] * z[j]
+                z[i] = acc / chol[t, i, i]
+                acc_sq += z[i] * z[i]
+            out[t, n] = acc_sq
+    return out
+
 
 class KalmanFilterXYAH:
     """
@@ -19,11 +180,16 @@ class KalmanFilterXYAH:
 
     Methods:
         initiate: Create a track from an unassociated measurement.
+        initiate_batch: Create tracks from many unassociated measurements (vectorized version).
         predict: Run the Kalman filter prediction step.
         project: Project the state distribution to measurement space.
         multi_predict: Run the Kalman filter prediction step (vectorized version).
+        multi_predict_into: Run the vectorized prediction step in place, with a caller-owned scratch buffer.
+        multi_project: Project multiple state distributions to measurement space (vectorized version).
         update: Run the Kalman filter correction step.
         gating_distance: Compute the gating distance between state distribution and measurements.
+        batch_gating_distance: Compute the gating distances between many state distributions and measurements.
+        gating_mask: Flag the measurements that fall inside the chi-square gate of one or many state distributions.
 
     Examples:
         Initialize the Kalman filter and create a track from a measurement
@@ -41,19 +207,28 @@ class KalmanFilterXYAH:
         The Kalman filter is initialized with an 8-dimensional state space (x, y, a, h, vx, vy, va, vh), where (x, y)
         represents the bounding box center position, 'a' is the aspect ratio, 'h' is the height, and their respective
         velocities are (vx, vy, va, vh). The filter uses a constant velocity model for object motion and a linear
-        observation model for bounding box location.
+        observation model for bounding box location. All model matrices and new states are float32, which is ample
+        for pixel coordinates and halves the memory traffic of the batched covariance updates.
 
         Examples:
             Initialize a Kalman filter for tracking:
             >>> kf = KalmanFilterXYAH()
         """
         ndim, dt = 4, 1.0
+        self._dtype = numpy.float32
 
         # Create Kalman filter model matrices
-        self._motion_mat = numpy.eye(2 * ndim, 2 * ndim)
+        self._motion_mat = numpy.eye(2 * ndim, 2 * ndim, dtype=self._dtype)
         for i in range(ndim):
             self._motion_mat[i, ndim + i] = dt
-        self._update_mat = numpy.eye(ndim, 2 * ndim)
+        self._update_mat = numpy.eye(ndim, 2 * ndim, dtype=self._dtype)
+        # State-independent constants, built once: contiguous transposes for matmul and the diagonal indices of an 8x8
+        self._motion_mat_T = self._motion_mat.T.copy()
+        self._update_mat_T = self._update_mat.T.copy()
+        self._diag8 = numpy.arange(2 * ndim)
+        # Scratch for the per-call process/measurement noise of `predict` and `project`; the values are consumed before
+        # the call returns, so a single buffer per filter instance is enough (filters are not shared across threads)
+        self._scratch_std = numpy.empty(2 * ndim, dtype=self._dtype)
 
         # Motion and observation uncertainty are chosen relative to the current state estimate
         self._std_weight_position = 1.0 / 20
@@ -76,7 +251,7 @@ class KalmanFilterXYAH:
             >>> measurement = numpy.array([100, 50, 1.5, 200])
             >>> mean, covariance = kf.initiate(measurement)
         """
-        mean_pos = measurement
+        mean_pos = numpy.asarray(measurement, dtype=self._dtype)
         mean_vel = numpy.zeros_like(mean_pos)
         mean = numpy.r_[mean_pos, mean_vel]
 
@@ -90,9 +265,44 @@ class KalmanFilterXYAH:
             1e-5,
             10 * self._std_weight_velocity * measurement[3],
         ]
-        covariance = numpy.diag(numpy.square(std))
+        covariance = numpy.diag(numpy.square(numpy.asarray(std, dtype=self._dtype)))
         return mean, covariance
 
+    def initiate_batch(self, measurements: numpy.ndarray):
+        """
+        Create tracks from N unassociated measurements at once (Vectorized version of `initiate`).
+
+        Args:
+            measurements (numpy.ndarray): The Nx4 matrix of (x, y, a, h) bounding boxes.
+
+        Returns:
+            mean (numpy.ndarray): Mean matrix of the new tracks with shape (N, 8), velocities initialized to 0.
+            covariance (numpy.ndarray): Covariance matrices of the new tracks with shape (N, 8, 8).
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> measurements = numpy.array([[100, 50, 1.5, 200], [300, 80, 0.5, 60]])
+            >>> means, covariances = kf.initiate_batch(measurements)
+        """
+        measurements = numpy.asarray(measurements, dtype=self._dtype)
+        mean = numpy.zeros((len(measurements), 8), dtype=self._dtype)
+        mean[:, :4] = measurements
+
+        h = measurements[:, 3]
+        std2 = numpy.empty((len(measurements), 8), dtype=self._dtype)
+        std2[:, 0] = std2[:, 1] = std2[:, 3] = numpy.square(2 * self._std_weight_position * h)
+        std2[:, 2] = 1e-2**2
+        std2[:, 4] = std2[:, 5] = std2[:, 7] = numpy.square(10 * self._std_weight_velocity * h)
+        std2[:, 6] = 1e-5**2
+
+        covariance = numpy.zeros((len(measurements), 8, 8), dtype=self._dtype)
+        covariance[:, self._diag8, self._diag8] = std2
+        return mean, covariance
+
+    def _as_state_dtype(self, *arrays: numpy.ndarray) -> tuple:
+        """Return `arrays` in the filter dtype, so the numba and NumPy paths produce the same output dtype."""
+        return tuple(numpy.asarray(a, dtype=self._dtype) for a in arrays)
+
     def predict(self, mean: numpy.ndarray, covariance: numpy.ndarray):
         """
         Run Kalman filter prediction step.
@@ -111,22 +321,19 @@ class KalmanFilterXYAH:
             >>> covariance = numpy.eye(8)
             >>> predicted_mean, predicted_covariance = kf.predict(mean, covariance)
         """
-        std_pos = [
-            self._std_weight_position * mean[3],
-            self._std_weight_position * mean[3],
-            1e-2,
-            self._std_weight_position * mean[3],
-        ]
-        std_vel = [
-            self._std_weight_velocity * mean[3],
-            self._std_weight_velocity * mean[3],
-            1e-5,
-            self._std_weight_velocity * mean[3],
-        ]
-        motion_cov = numpy.diag(numpy.square(numpy.r_[std_pos, std_vel]))
-
-        mean = numpy.dot(mean, self._motion_mat.T)
-        covariance = numpy.linalg.multi_dot((self._motion_mat, covariance, self._motion_mat.T)) + motion_cov
+        mean, covariance = self._as_state_dtype(mean, covariance)
+        motion_var = self._scratch_std
+        motion_var[0] = motion_var[1] = motion_var[3] = self._std_weight_position * mean[3]
+        motion_var[2] = 1e-2
+        motion_var[4] = motion_var[5] = motion_var[7] = self._std_weight_velocity * mean[3]
+        motion_var[6] = 1e-5
+        numpy.square(motion_var, out=motion_var)
+        if _kf_predict_njit is not None:
+            return _kf_predict_njit(mean, covariance, self._motion_mat, motion_var)
+
+        mean = numpy.dot(mean, self._motion_mat_T)
+        covariance = (self._motion_mat @ covariance) @ self._motion_mat_T
+        covariance[self._diag8, self._diag8] += motion_var  # add the diagonal motion noise in place
 
         return mean, covariance
 
@@ -148,17 +355,18 @@ class KalmanFilterXYAH:
             >>> covariance = numpy.eye(8)
             >>> projected_mean, projected_covariance = kf.project(mean, covariance)
         """
-        std = [
-            self._std_weight_position * mean[3],
-            self._std_weight_position * mean[3],
-            1e-1,
-            self._std_weight_position * mean[3],
-        ]
-        innovation_cov = numpy.diag(numpy.square(std))
+        mean, covariance = self._as_state_dtype(mean, covariance)
+        innovation_var = self._scratch_std[:4]
+        innovation_var[0] = innovation_var[1] = innovation_var[3] = self._std_weight_position * mean[3]
+        innovation_var[2] = 1e-1
+        numpy.square(innovation_var, out=innovation_var)
+        if _kf_project_njit is not None:
+            return _kf_project_njit(mean, covariance, self._update_mat, innovation_var)
 
         mean = numpy.dot(self._update_mat, mean)
-        covariance = numpy.linalg.multi_dot((self._update_mat, covariance, self._update_mat.T))
-        return mean, covariance + innovation_cov
+        covariance = self._update_mat @ (covariance @ self._update_mat_T)
+        covariance[self._diag8[:4], self._diag8[:4]] += innovation_var
+        return mean, covariance
 
     def multi_predict(self, mean: numpy.ndarray, covariance: numpy.ndarray):
         """
@@ -177,27 +385,83 @@ class KalmanFilterXYAH:
             >>> covariance = numpy.random.rand(10, 8, 8)  # Covariance matrices for 10 object states
             >>> predicted_mean, predicted_covariance = kalman_filter.multi_predict(mean, covariance)
         """
-        std_pos = [
-            self._std_weight_position * mean[:, 3],
-            self._std_weight_position * mean[:, 3],
-            1e-2 * numpy.ones_like(mean[:, 3]),
-            self._std_weight_position * mean[:, 3],
-        ]
-        std_vel = [
-            self._std_weight_velocity * mean[:, 3],
-            self._std_weight_velocity * mean[:, 3],
-            1e-5 * numpy.ones_like(mean[:, 3]),
-            self._std_weight_velocity * mean[:, 3],
-        ]
-        sqr = numpy.square(numpy.r_[std_pos, std_vel]).T
+        sqr = self._multi_motion_var(mean)
+
+        motion_cov = numpy.zeros((len(mean), 8, 8), dtype=sqr.dtype)
+        motion_cov[:, self._diag8, self._diag8] = sqr  # write all N diagonals at once
+
+        mean = mean @ self._motion_mat_T
+        covariance = (self._motion_mat @ covariance) @ self._motion_mat_T + motion_cov  # batched matmul over N
+
+        return mean, covariance
+
+    def multi_predict_into(self, mean: numpy.ndarray, covariance: numpy.ndarray, tmp_buf: numpy.ndarray) -> None:
+        """
+        Run the vectorized Kalman filter prediction step in place.
 
-        motion_cov = [numpy.diag(sqr[i]) for i in range(len(mean))]
-        motion_cov = numpy.asarray(motion_cov)
+        Same result as `multi_predict`, but `mean` and `covariance` are overwritten and the intermediate product goes
+        to a caller-owned scratch buffer, so a tracker with a stable track count does not allocate (N, 8, 8) arrays
+        every frame.
 
-        mean = numpy.dot(mean, self._motion_mat.T)
-        left = numpy.dot(self._motion_mat, covariance).transpose((1, 0, 2))
-        covariance = numpy.dot(left, self._motion_mat.T) + motion_cov
+        Args:
+            mean (numpy.ndarray): The Nx8 mean matrix of the object states, updated in place.
+            covariance (numpy.ndarray): The Nx8x8 covariance matrix of the object states, updated in place.
+            tmp_buf (numpy.ndarray): Scratch buffer of shape (M, 8, 8) with M >= N; only `tmp_buf[:N]` is used.
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> mean = numpy.random.rand(10, 8).astype(numpy.float32)
+            >>> covariance = numpy.tile(numpy.eye(8, dtype=numpy.float32), (10, 1, 1))
+            >>> tmp_buf = numpy.empty((64, 8, 8), dtype=numpy.float32)
+            >>> kf.multi_predict_into(mean, covariance, tmp_buf)
+        """
+        n = len(mean)
+        motion_var = self._multi_motion_var(mean)  # from the previous state, before `mean` is overwritten
+
+        numpy.matmul(mean, self._motion_mat_T, out=mean)
+        numpy.matmul(self._motion_mat, covariance, out=tmp_buf[:n])
+        numpy.matmul(tmp_buf[:n], self._motion_mat_T, out=covariance)
+        covariance[:, self._diag8, self._diag8] += motion_var
+
+    def _multi_motion_var(self, mean: numpy.ndarray) -> numpy.ndarray:
+        """Return the (N, 8) motion noise variances for the (N, 8) states `mean`."""
+        h = mean[:, 3]
+        std2 = numpy.empty((len(mean), 8), dtype=self._dtype)  # squared stds, one column per state dimension
+        std2[:, 0] = std2[:, 1] = std2[:, 3] = numpy.square(self._std_weight_position * h)
+        std2[:, 2].fill(1e-2**2)
+        std2[:, 4] = std2[:, 5] = std2[:, 7] = numpy.square(self._std_weight_velocity * h)
+        std2[:, 6].fill(1e-5**2)
+        return std2
+
+    def multi_project(self, mean: numpy.ndarray, covariance: numpy.ndarray):
+        """
+        Project multiple state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (numpy.ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (numpy.ndarray): The Nx8x8 covariance matrix of the object states.
 
+        Returns:
+            mean (numpy.ndarray): Projected means with shape (N, 4).
+            covariance (numpy.ndarray): Projected covariance matrices with shape (N, 4, 4).
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> mean = numpy.random.rand(10, 8)
+            >>> covariance = numpy.tile(numpy.eye(8), (10, 1, 1))
+            >>> projected_mean, projected_covariance = kf.multi_project(mean, covariance)
+        """
+        std2 = numpy.empty((len(mean), 4), dtype=self._dtype)
+        std2[:, 0] = std2[:, 1] = std2[:, 3] = numpy.square(self._std_weight_position * mean[:, 3])
+        std2[:, 2].fill(1e-1**2)
+        return self._project_batch(mean, covariance, std2)
+
+    def _project_batch(self, mean: numpy.ndarray, covariance: numpy.ndarray, innovation_var: numpy.ndarray):
+        """Project (N, 8) means and (N, 8, 8) covariances, adding the (N, 4) innovation variances on the diagonal."""
+        mean = mean @ self._update_mat_T
+        covariance = (self._update_mat @ covariance) @ self._update_mat_T  # broadcast matmuls, (N, 4, 8) -> (N, 4, 4)
+        diag = self._diag8[:4]
+        covariance[:, diag, diag] += innovation_var
         return mean, covariance
 
     def update(self, mean: numpy.ndarray, covariance: numpy.ndarray, measurement: numpy.ndarray):
@@ -221,16 +485,19 @@ class KalmanFilterXYAH:
             >>> measurement = numpy.array([1, 1, 1, 1])
             >>> new_mean, new_covariance = kf.update(mean, covariance, measurement)
         """
+        mean, covariance, measurement = self._as_state_dtype(mean, covariance, measurement)
         projected_mean, projected_cov = self.project(mean, covariance)
+        if _kf_update_njit is not None:
+            return _kf_update_njit(mean, covariance, projected_mean, projected_cov, measurement, self._update_mat)
 
         chol_factor, lower = scipy.linalg.cho_factor(projected_cov, lower=True, check_finite=False)
         kalman_gain = scipy.linalg.cho_solve(
-            (chol_factor, lower), numpy.dot(covariance, self._update_mat.T).T, check_finite=False
+            (chol_factor, lower), numpy.dot(covariance, self._update_mat_T).T, check_finite=False
         ).T
         innovation = measurement - projected_mean
 
         new_mean = mean + numpy.dot(innovation, kalman_gain.T)
-        new_covariance = covariance - numpy.linalg.multi_dot((kalman_gain, projected_cov, kalman_gain.T))
+        new_covariance = covariance - kalman_gain @ (projected_cov @ kalman_gain.T)  # (4, 4) @ (4, 8) first
         return new_mean, new_covariance
 
     def gating_distance(
@@ -283,6 +550,94 @@ class KalmanFilterXYAH:
         else:
             raise ValueError("Invalid distance metric")
 
+    def batch_gating_distance(
+        self,
+        mean: numpy.ndarray,
+        covariance: numpy.ndarray,
+        measurements: numpy.ndarray,
+        only_position: bool = False,
+        metric: str = "maha",
+    ) -> numpy.ndarray:
+        """
+        Compute gating distances between T state distributions and N measurements in one batched pass.
+
+        Equivalent to stacking `gating_distance` over the tracks, but all states are projected at once and the
+        Mahalanobis distances come from one batched Cholesky factorization instead of a Python loop per track.
+
+        Args:
+            mean (numpy.ndarray): The Tx8 dimensional mean matrix of the state distributions.
+            covariance (numpy.ndarray): The Tx8x8 covariance matrix of the state distributions.
+            measurements (numpy.ndarray): An (N, 4) matrix of N measurements in the filter's measurement format.
+            only_position (bool, optional): If True, distance computation is done with respect to box center position only.
+            metric (str, optional): 'gaussian' for the squared Euclidean distance and 'maha' for the squared
+                Mahalanobis distance.
+
+        Returns:
+            (numpy.ndarray): A (T, N) array whose (t, n) element is the squared distance between track t and
+                `measurements[n]`.
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> mean = numpy.random.rand(3, 8)
+            >>> covariance = numpy.tile(numpy.eye(8), (3, 1, 1))
+            >>> measurements = numpy.array([[1, 1, 1, 1], [2, 2, 1, 1]])
+            >>> distances = kf.batch_gating_distance(mean, covariance, measurements)  # (3, 2)
+        """
+        mean, covariance = self.multi_project(mean, covariance)
+        if only_position:
+            mean, covariance = mean[:, :2], covariance[:, :2, :2]
+            measurements = measurements[:, :2]
+
+        d = measurements[None, :, :] - mean[:, None, :]  # (T, N, k)
+        if metric == "gaussian":
+            return numpy.sum(d * d, axis=-1)
+        elif metric == "maha":
+            cholesky_factor = numpy.linalg.cholesky(covariance)  # (T, k, k)
+            if _batch_maha_njit is not None:
+                return _batch_maha_njit(cholesky_factor, numpy.ascontiguousarray(d))
+            z = numpy.linalg.solve(cholesky_factor, d.transpose(0, 2, 1))  # (T, k, N)
+            return numpy.sum(z * z, axis=1)  # square maha
+        else:
+            raise ValueError("Invalid distance metric")
+
+    def gating_mask(
+        self,
+        mean: numpy.ndarray,
+        covariance: numpy.ndarray,
+        measurements: numpy.ndarray,
+        threshold: Optional[float] = None,
+        only_position: bool = False,
+    ) -> numpy.ndarray:
+        """
+        Flag the measurements whose squared Mahalanobis distance is within `threshold`.
+
+        The comparison is done directly on the squared distances, so no square root is taken. A single state (8,)
+        gives an (N,) mask via `gating_distance`; stacked states (T, 8) give a (T, N) mask via `batch_gating_distance`.
+
+        Args:
+            mean (numpy.ndarray): Mean vector (8,) or matrix (T, 8) of the state distribution(s).
+            covariance (numpy.ndarray): Covariance (8, 8) or (T, 8, 8) of the state distribution(s).
+            measurements (numpy.ndarray): An (N, 4) matrix of N measurements in the filter's measurement format.
+            threshold (float, optional): Gate on the squared distance. Defaults to `chi2inv95` for 4 degrees of
+                freedom, or 2 if `only_position` is True.
+            only_position (bool, optional): If True, distance computation is done with respect to box center position only.
+
+        Returns:
+            (numpy.ndarray): Boolean mask of shape (N,) or (T, N), True where the measurement passes the gate.
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> mean, covariance = kf.initiate(numpy.array([100, 50, 1.5, 200]))
+            >>> mask = kf.gating_mask(mean, covariance, numpy.array([[101, 51, 1.5, 200], [400, 50, 1.5, 200]]))
+        """
+        if threshold is None:
+            threshold = chi2inv95[2 if only_position else 4]
+        if mean.ndim == 2:
+            distance = self.batch_gating_distance(mean, covariance, measurements, only_position)
+        else:
+            distance = self.gating_distance(mean, covariance, measurements, only_position)
+        return numpy.less_equal(distance, threshold)
+
 
 class KalmanFilterXYWH(KalmanFilterXYAH):
     """
@@ -301,9 +656,11 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
 
     Methods:
         initiate: Create a track from an unassociated measurement.
+        initiate_batch: Create tracks from many unassociated measurements (vectorized version).
         predict: Run the Kalman filter prediction step.
         project: Project the state distribution to measurement space.
         multi_predict: Run the Kalman filter prediction step in a vectorized manner.
+        multi_project: Project multiple state distributions to measurement space in a vectorized manner.
         update: Run the Kalman filter correction step.
 
     Examples:
@@ -342,7 +699,7 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
              [ 0.  0.  0.  0.  0.  0.  0.25  0.]
              [ 0.  0.  0.  0.  0.  0.  0.  0.25]]
         """
-        mean_pos = measurement
+        mean_pos = numpy.asarray(measurement, dtype=self._dtype)
         mean_vel = numpy.zeros_like(mean_pos)
         mean = numpy.r_[mean_pos, mean_vel]
 
@@ -356,7 +713,36 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
             10 * self._std_weight_velocity * measurement[2],
             10 * self._std_weight_velocity * measurement[3],
         ]
-        covariance = numpy.diag(numpy.square(std))
+        covariance = numpy.diag(numpy.square(numpy.asarray(std, dtype=self._dtype)))
+        return mean, covariance
+
+    def initiate_batch(self, measurements: numpy.ndarray):
+        """
+        Create tracks from N unassociated measurements at once (Vectorized version of `initiate`).
+
+        Args:
+            measurements (numpy.ndarray): The Nx4 matrix of (x, y, w, h) bounding boxes.
+
+        Returns:
+            mean (numpy.ndarray): Mean matrix of the new tracks with shape (N, 8), velocities initialized to 0.
+            covariance (numpy.ndarray): Covariance matrices of the new tracks with shape (N, 8, 8).
+
+        Examples:
+            >>> kf = KalmanFilterXYWH()
+            >>> measurements = numpy.array([[100, 50, 20, 40], [300, 80, 30, 60]])
+            >>> means, covariances = kf.initiate_batch(measurements)
+        """
+        measurements = numpy.asarray(measurements, dtype=self._dtype)
+        mean = numpy.zeros((len(measurements), 8), dtype=self._dtype)
+        mean[:, :4] = measurements
+
+        wh = measurements[:, 2:4]
+        std2 = numpy.empty((len(measurements), 8), dtype=self._dtype)
+        std2[:, 0:2] = std2[:, 2:4] = numpy.square(2 * self._std_weight_position * wh)
+        std2[:, 4:6] = std2[:, 6:8] = numpy.square(10 * self._std_weight_velocity * wh)
+
+        covariance = numpy.zeros((len(measurements), 8, 8), dtype=self._dtype)
+        covariance[:, self._diag8, self._diag8] = std2
         return mean, covariance
 
     def predict(self, mean: numpy.ndarray, covariance: numpy.ndarray):
@@ -377,22 +763,19 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
             >>> covariance = numpy.eye(8)
             >>> predicted_mean, predicted_covariance = kf.predict(mean, covariance)
         """
-        std_pos = [
-            self._std_weight_position * mean[2],
-            self._std_weight_position * mean[3],
-            self._std_weight_position * mean[2],
-            self._std_weight_position * mean[3],
-        ]
-        std_vel = [
-            self._std_weight_velocity * mean[2],
-            self._std_weight_velocity * mean[3],
-            self._std_weight_velocity * mean[2],
-            self._std_weight_velocity * mean[3],
-        ]
-        motion_cov = numpy.diag(numpy.square(numpy.r_[std_pos, std_vel]))
-
-        mean = numpy.dot(mean, self._motion_mat.T)
-        covariance = numpy.linalg.multi_dot((self._motion_mat, covariance, self._motion_mat.T)) + motion_cov
+        mean, covariance = self._as_state_dtype(mean, covariance)
+        motion_var = self._scratch_std
+        motion_var[0] = motion_var[2] = self._std_weight_position * mean[2]
+        motion_var[1] = motion_var[3] = self._std_weight_position * mean[3]
+        motion_var[4] = motion_var[6] = self._std_weight_velocity * mean[2]
+        motion_var[5] = motion_var[7] = self._std_weight_velocity * mean[3]
+        numpy.square(motion_var, out=motion_var)
+        if _kf_predict_njit is not None:
+            return _kf_predict_njit(mean, covariance, self._motion_mat, motion_var)
+
+        mean = numpy.dot(mean, self._motion_mat_T)
+        covariance = (self._motion_mat @ covariance) @ self._motion_mat_T
+        covariance[self._diag8, self._diag8] += motion_var  # add the diagonal motion noise in place
 
         return mean, covariance
 
@@ -414,17 +797,18 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
             >>> covariance = numpy.eye(8)
             >>> projected_mean, projected_cov = kf.project(mean, covariance)
         """
-        std = [
-            self._std_weight_position * mean[2],
-            self._std_weight_position * mean[3],
-            self._std_weight_position * mean[2],
-            self._std_weight_position * mean[3],
-        ]
-        innovation_cov = numpy.diag(numpy.square(std))
+        mean, covariance = self._as_state_dtype(mean, covariance)
+        innovation_var = self._scratch_std[:4]
+        innovation_var[0] = innovation_var[2] = self._std_weight_position * mean[2]
+        innovation_var[1] = innovation_var[3] = self._std_weight_position * mean[3]
+        numpy.square(innovation_var, out=innovation_var)
+        if _kf_project_njit is not None:
+            return _kf_project_njit(mean, covariance, self._update_mat, innovation_var)
 
         mean = numpy.dot(self._update_mat, mean)
-        covariance = numpy.linalg.multi_dot((self._update_mat, covariance, self._update_mat.T))
-        return mean, covariance + innovation_cov
+        covariance = self._update_mat @ (covariance @ self._update_mat_T)
+        covariance[self._diag8[:4], self._diag8[:4]] += innovation_var
+        return mean, covariance
 
     def multi_predict(self, mean: numpy.ndarray, covariance: numpy.ndarray):
         """
@@ -444,28 +828,37 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
             >>> kf = KalmanFilterXYWH()
             >>> predicted_mean, predicted_covariance = kf.multi_predict(mean, covariance)
         """
-        std_pos = [
-            self._std_weight_position * mean[:, 2],
-            self._std_weight_position * mean[:, 3],
-            self._std_weight_position * mean[:, 2],
-            self._std_weight_position * mean[:, 3],
-        ]
-        std_vel = [
-            self._std_weight_velocity * mean[:, 2],
-            self._std_weight_velocity * mean[:, 3],
-            self._std_weight_velocity * mean[:, 2],
-            self._std_weight_velocity * mean[:, 3],
-        ]
-        sqr = numpy.square(numpy.r_[std_pos, std_vel]).T
+        return super().multi_predict(mean, covariance)
 
-        motion_cov = [numpy.diag(sqr[i]) for i in range(len(mean))]
-        motion_cov = numpy.asarray(motion_cov)
+    def _multi_motion_var(self, mean: numpy.ndarray) -> numpy.ndarray:
+        """Return the (N, 8) motion noise variances for the (N, 8) states `mean`."""
+        wh = mean[:, 2:4]
+        std2 = numpy.empty((len(mean), 8), dtype=self._dtype)  # squared stds, one column per state dimension
+        std2[:, 0:2] = std2[:, 2:4] = numpy.square(self._std_weight_position * wh)
+        std2[:, 4:6] = std2[:, 6:8] = numpy.square(self._std_weight_velocity * wh)
+        return std2
 
-        mean = numpy.dot(mean, self._motion_mat.T)
-        left = numpy.dot(self._motion_mat, covariance).transpose((1, 0, 2))
-        covariance = numpy.dot(left, self._motion_mat.T) + motion_cov
+    def multi_project(self, mean: numpy.ndarray, covariance: numpy.ndarray):
+        """
+        Project multiple state distributions to measurement space (Vectorized version).
 
-        return mean, covariance
+        Args:
+            mean (numpy.ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (numpy.ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            mean (numpy.ndarray): Projected means with shape (N, 4).
+            covariance (numpy.ndarray): Projected covariance matrices with shape (N, 4, 4).
+
+        Examples:
+            >>> kf = KalmanFilterXYWH()
+            >>> mean = numpy.random.rand(10, 8)
+            >>> covariance = numpy.tile(numpy.eye(8), (10, 1, 1))
+            >>> projected_mean, projected_covariance = kf.multi_project(mean, covariance)
+        """
+        std2 = numpy.empty((len(mean), 4), dtype=self._dtype)
+        std2[:, 0:2] = std2[:, 2:4] = numpy.square(self._std_weight_position * mean[:, 2:4])
+        return self._project_batch(mean, covariance, std2)
 
     def update(self, mean: numpy.ndarray, covariance: numpy.ndarray, measurement: numpy.ndarray):
         """
@@ -1,8 +1,48 @@
+from typing import Optional
+
 import numpy
+import scipy.optimize
 from scipy.spatial.distance import cdist
 
+from .metrics import batch_probiou, bbox_ioa
+
 
-def embedding_distance(tracks: list, detections: list, metric: str = "cosine") -> np.ndarray:
+def linear_assignment(cost_matrix: numpy.ndarray, thresh: float) -> tuple:
+    """
+    Perform linear assignment using scipy's linear_sum_assignment.
+
+    Args:
+        cost_matrix (numpy.ndarray): The matrix containing cost values for assignments, with shape (N, M).
+        thresh (float): Threshold for considering an assignment valid.
+
+    Returns:
+        matched_indices (numpy.ndarray): Array of matched (track, detection) index pairs with shape (K, 2).
+        unmatched_a (list): Indices of the unmatched rows (tracks).
+        unmatched_b (list): Indices of the unmatched columns (detections).
+
+    Examples:
+        >>> cost_matrix = numpy.array([[0.1, 0.9], [0.8, 0.2]])
+        >>> matches, unmatched_a, unmatched_b = linear_assignment(cost_matrix, thresh=0.5)
+        >>> matches.tolist(), unmatched_a, unmatched_b
+        ([[0, 0], [1, 1]], [], [])
+    """
+    if cost_matrix.size == 0:
+        return numpy.empty((0, 2), dtype=int), list(range(cost_matrix.shape[0])), list(range(cost_matrix.shape[1]))
+    x, y = scipy.optimize.linear_sum_assignment(cost_matrix)  # row x, col y
+    keep = cost_matrix[x, y] <= thresh
+    matches = numpy.stack([x[keep], y[keep]], axis=1)
+    unmatched_a = numpy.setdiff1d(numpy.arange(cost_matrix.shape[0]), matches[:, 0]).tolist()
+    unmatched_b = numpy.setdiff1d(numpy.arange(cost_matrix.shape[1]), matches[:, 1]).tolist()
+    return matches, unmatched_a, unmatched_b
+
+
+def embedding_distance(
+    tracks: list,
+    detections: list,
+    metric: str = "cosine",
+    track_feats: Optional[numpy.ndarray] = None,
+    det_feats: Optional[numpy.ndarray] = None,
+) -> numpy.ndarray:
     """
     Compute distance between tracks and detections based on embeddings.
 
@@ -10,6 +50,10 @@ def embedding_distance(tracks: list, detections: list, metric: str = "cosine") -
         tracks (List[STrack]): List of tracks, where each track contains embedding features.
         detections (List[BaseTrack]): List of detections, where each detection contains embedding features.
         metric (str): Metric for distance computation. Supported metrics include 'cosine', 'euclidean', etc.
+        track_feats (numpy.ndarray, optional): Pre-stacked (N, D) float32 track features, in `tracks` order. Gathered
+            from `track.smooth_feat` if None.
+        det_feats (numpy.ndarray, optional): Pre-stacked (M, D) float32 detection features, in `detections` order.
+            Gathered from `det.curr_feat` if None.
 
     Returns:
         (numpy.ndarray): Cost matrix computed based on embeddings with shape (N, M), where N is the number of tracks
@@ -24,11 +68,18 @@ def embedding_distance(tracks: list, detections: list, metric: str = "cosine") -
     cost_matrix = numpy.zeros((len(tracks), len(detections)), dtype=numpy.float32)
     if cost_matrix.size == 0:
         return cost_matrix
-    det_features = numpy.asarray([track.curr_feat for track in detections], dtype=numpy.float32)
-    # for i, track in enumerate(tracks):
-    # cost_matrix[i, :] = numpy.maximum(0.0, cdist(track.smooth_feat.reshape(1,-1), det_features, metric))
-    track_features = numpy.asarray([track.smooth_feat for track in tracks], dtype=numpy.float32)
-    cost_matrix = numpy.maximum(0.0, cdist(track_features, det_features, metric))  # Normalized features
+    det_features = det_feats
+    if det_features is None:
+        det_features = numpy.stack([track.curr_feat for track in detections]).astype(numpy.float32, copy=False)
+    track_features = track_feats
+    if track_features is None:
+        track_features = numpy.stack([track.smooth_feat for track in tracks]).astype(numpy.float32, copy=False)
+    if metric == "cosine":
+        # 1 - cosine similarity as one GEMM; rows are re-normalized (out of place, the inputs may be caller-owned)
+        track_features = track_features / numpy.linalg.norm(track_features, axis=1, keepdims=True)
+        det_features = det_features / numpy.linalg.norm(det_features, axis=1, keepdims=True)
+        return numpy.maximum(0.0, 1.0 - track_features @ det_features.T)
+    cost_matrix = numpy.maximum(0.0, cdist(track_features, det_features, metric))
     return cost_matrix
 
 
@@ -49,29 +100,28 @@ def iou_distance(atracks: list, btracks: list) -> numpy.ndarray:
         >>> btracks = [numpy.array([5, 5, 15, 15]), numpy.array([25, 25, 35, 35])]
         >>> cost_matrix = iou_distance(atracks, btracks)
     """
-    if atracks and isinstance(atracks[0], numpy.ndarray) or btracks and isinstance(btracks[0], numpy.ndarray):
-        atlbrs = atracks
-        btlbrs = btracks
-    else:
-        atlbrs = [track.xywha if track.angle is not None else track.xyxy for track in atracks]
-        btlbrs = [track.xywha if track.angle is not None else track.xyxy for track in btracks]
-
-    ious = numpy.zeros((len(atlbrs), len(btlbrs)), dtype=numpy.float32)
-    if len(atlbrs) and len(btlbrs):
-        if len(atlbrs[0]) == 5 and len(btlbrs[0]) == 5:
-            ious = batch_probiou(
-                numpy.ascontiguousarray(atlbrs, dtype=numpy.float32),
-                numpy.ascontiguousarray(btlbrs, dtype=numpy.float32),
-            ).numpy()
+    ious = numpy.zeros((len(atracks), len(btracks)), dtype=numpy.float32)
+    if len(atracks) and len(btracks):
+        if isinstance(atracks[0], numpy.ndarray) or isinstance(btracks[0], numpy.ndarray):
+            atlbrs = numpy.ascontiguousarray(atracks, dtype=numpy.float32)
+            btlbrs = numpy.ascontiguousarray(btracks, dtype=numpy.float32)
         else:
-            ious = bbox_ioa(
-                numpy.ascontiguousarray(atlbrs, dtype=numpy.float32),
-                numpy.ascontiguousarray(btlbrs, dtype=numpy.float32),
-                iou=True,
-            )
+            atlbrs, btlbrs = _stack_boxes(atracks), _stack_boxes(btracks)
+        if atlbrs.shape[1] == 5 and btlbrs.shape[1] == 5:
+            ious = batch_probiou(atlbrs, btlbrs).numpy()
+        else:
+            ious = bbox_ioa(atlbrs, btlbrs, iou=True)
     return 1 - ious  # cost matrix
 
 
+def _stack_boxes(tracks: list) -> numpy.ndarray:
+    """Write the cached `iou_box` of each track into one contiguous float32 array of shape (len(tracks), 4 or 5)."""
+    boxes = numpy.empty((len(tracks), len(tracks[0].iou_box)), dtype=numpy.float32)
+    for i, track in enumerate(tracks):
+        boxes[i] = track.iou_box
+    return boxes
+
+
 def fuse_score(cost_matrix: numpy.ndarray, detections: list) -> numpy.ndarray:
     """
     Fuse cost matrix with detection scores to produce a single similarity matrix.
@@ -91,8 +141,5 @@ def fuse_score(cost_matrix: numpy.ndarray, detections: list) -> numpy.ndarray:
     """
     if cost_matrix.size == 0:
         return cost_matrix
-    iou_sim = 1 - cost_matrix
-    det_scores = numpy.array([det.score for det in detections])
-    det_scores = numpy.expand_dims(det_scores, axis=0).repeat(cost_matrix.shape[0], axis=0)
-    fuse_sim = iou_sim * det_scores
-    return 1 - fuse_sim  # fuse_cost
+    det_scores = numpy.fromiter((det.score for det in detections), dtype=cost_matrix.dtype, count=len(detections))
+    return 1 - (1 - cost_matrix) * det_scores  # fuse_cost, scores broadcast across the track rows
@@ -0,0 +1,107 @@
+import numpy
+import torch
+
+
+def bbox_ioa(
+    box1: numpy.ndarray, box2: numpy.ndarray, iou: bool = False, eps: float = 1e-7
+) -> numpy.ndarray:
+    """
+    Calculate the intersection over box2 area given box1 and box2.
+
+    Args:
+        box1 (numpy.ndarray): Array of shape (N, 4) holding N bounding boxes in x1y1x2y2 format.
+        box2 (numpy.ndarray): Array of shape (M, 4) holding M bounding boxes in x1y1x2y2 format.
+        iou (bool, optional): Calculate the standard IoU if True else return inter_area/box2_area.
+        eps (float, optional): A small value to avoid division by zero.
+
+    Returns:
+        (numpy.ndarray): A numpy array of shape (N, M) representing the intersection over box2 area.
+
+    Examples:
+        >>> box1 = numpy.array([[0, 0, 10, 10]], dtype=numpy.float32)
+        >>> box2 = numpy.array([[5, 0, 15, 10]], dtype=numpy.float32)
+        >>> bbox_ioa(box1, box2, iou=True).round(4)
+        array([[0.3333]], dtype=float32)
+    """
+    # Get the coordinates of bounding boxes
+    b1_x1, b1_y1, b1_x2, b1_y2 = box1.T
+    b2_x1, b2_y1, b2_x2, b2_y2 = box2.T
+
+    # Intersection area
+    inter_w = numpy.minimum(b1_x2[:, None], b2_x2) - numpy.maximum(b1_x1[:, None], b2_x1)
+    inter_h = numpy.minimum(b1_y2[:, None], b2_y2) - numpy.maximum(b1_y1[:, None], b2_y1)
+    inter_area = inter_w.clip(0) * inter_h.clip(0)
+
+    # Box2 area
+    area = (b2_x2 - b2_x1) * (b2_y2 - b2_y1)
+    if iou:
+        box1_area = (b1_x2 - b1_x1) * (b1_y2 - b1_y1)
+        area = area + box1_area[:, None] - inter_area
+
+    # Intersection over box2 area
+    return inter_area / (area + eps)
+
+
+def _get_covariance_matrix(boxes: torch.Tensor) -> tuple:
+    """
+    Generate covariance matrix from oriented bounding boxes.
+
+    Args:
+        boxes (torch.Tensor): Tensor of shape (N, 5) holding rotated bounding boxes in xywhr format.
+
+    Returns:
+        (tuple): The (a, b, c) entries of the covariance matrices, each of shape (N, 1).
+    """
+    # Gaussian bounding boxes; the center points (the first two columns) are not needed here
+    gbbs = torch.cat((boxes[:, 2:4].pow(2) / 12, boxes[:, 4:]), dim=-1)
+    a, b, c = gbbs.split(1, dim=-1)
+    cos = c.cos()
+    sin = c.sin()
+    cos2 = cos.pow(2)
+    sin2 = sin.pow(2)
+    return a * cos2 + b * sin2, a * sin2 + b * cos2, (a - b) * cos * sin
+
+
+def batch_probiou(obb1, obb2, eps: float = 1e-7) -> torch.Tensor:
+    """
+    Calculate the probabilistic IoU between oriented bounding boxes.
+
+    Args:
+        obb1 (torch.Tensor | numpy.ndarray): Shape (N, 5) ground truth obbs in xywhr format.
+        obb2 (torch.Tensor | numpy.ndarray): Shape (M, 5) predicted obbs in xywhr format.
+        eps (float, optional): A small value to avoid division by zero.
+
+    Returns:
+        (torch.Tensor): A tensor of shape (N, M) representing obb similarities.
+
+    References:
+        https://arxiv.org/pdf/2106.06072v1.pdf
+
+    Examples:
+        >>> obb1 = numpy.array([[10, 10, 4, 2, 0.0]], dtype=numpy.float32)
+        >>> batch_probiou(obb1, obb1).numpy().round(2)
+        array([[1.]], dtype=float32)
+    """
+    obb1 = torch.from_numpy(obb1) if isinstance(obb1, numpy.ndarray) else obb1
+    obb2 = torch.from_numpy(obb2) if isinstance(obb2, numpy.ndarray) else obb2
+
+    x1, y1 = obb1[..., :2].split(1, dim=-1)
+    x2, y2 = (x.squeeze(-1)[None] for x in obb2[..., :2].split(1, dim=-1))
+    a1, b1, c1 = _get_covariance_matrix(obb1)
+    a2, b2, c2 = (x.squeeze(-1)[None] for x in _get_covariance_matrix(obb2))
+
+    t1 = (
+        ((a1 + a2) * (y1 - y2).pow(2) + (b1 + b2) * (x1 - x2).pow(2))
+        / ((a1 + a2) * (b1 + b2) - (c1 + c2).pow(2) + eps)
+    ) * 0.25
+    t2 = (
+        ((c1 + c2) * (x2 - x1) * (y1 - y2)) / ((a1 + a2) * (b1 + b2) - (c1 + c2).pow(2) + eps)
+    ) * 0.5
+    t3 = (
+        ((a1 + a2) * (b1 + b2) - (c1 + c2).pow(2))
+        / (4 * ((a1 * b1 - c1.pow(2)).clamp_(0) * (a2 * b2 - c2.pow(2)).clamp_(0)).sqrt() + eps)
+        + eps
+    ).log() * 0.5
+    bd = (t1 + t2 + t3).clamp(eps, 100.0)
+    hd = (1.0 - (-bd).exp() + eps).sqrt()
+    return 1 - hd
@@ -1,4 +0,0 @@
-from nmea2xyz import hello
-
-def test_hello():
-    assert hello("world") == "Hello, world!"
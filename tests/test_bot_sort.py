@@ -0,0 +1,39 @@
+import numpy
+
+from trackobjs._trackobjs import tracker_cfg_pathmap
+from trackobjs.trackers.basetrack import TrackState
+from trackobjs.trackers.bot_sort import BOTSORT, BOTrack
+from trackobjs.trackers.utils import YAML, make_frozen_cfg
+
+
+def _tracker():
+    return BOTSORT(make_frozen_cfg(YAML.load(tracker_cfg_pathmap["botsort"])), frame_rate=30)
+
+
+def _tracks(n, kalman_filter):
+    tracks = []
+    for i in range(n):
+        track = BOTrack(numpy.array([10.0 * i, 20.0, 5.0, 8.0, i]), 0.9, 0)
+        track.mean, track.covariance = kalman_filter.initiate(track.tlwh_to_xywh(track._tlwh))
+        track.mean[4:] = 1.0
+        track.state = TrackState.Tracked
+        tracks.append(track)
+    return tracks
+
+
+def test_multi_predict_buffer_is_per_tracker():
+    tracker_a, tracker_b = _tracker(), _tracker()
+    buf_a, buf_b = tracker_a.predict_buf(3), tracker_b.predict_buf(5)
+    assert buf_a is not buf_b
+    assert len(buf_a) >= 3 and len(buf_b) >= 5
+    assert tracker_a.predict_buf(2) is buf_a  # reused while large enough
+
+
+def test_multi_predict_matches_single_predict():
+    tracker = _tracker()
+    tracks = _tracks(4, tracker.kalman_filter)
+    expected = [tracker.kalman_filter.predict(t.mean.copy(), t.covariance.copy()) for t in tracks]
+    tracker.multi_predict(tracks)
+    for track, (mean, covariance) in zip(tracks, expected, strict=True):
+        numpy.testing.assert_allclose(track.mean, mean, rtol=1e-5, atol=1e-4)
+        numpy.testing.assert_allclose(track.covariance, covariance, rtol=1e-5, atol=1e-4)
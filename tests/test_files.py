@@ -0,0 +1,104 @@
+import logging
+import sys
+import types
+
+import cv2
+import numpy
+import pytest
+
+from trackobjs.trackers.utils import files
+from trackobjs.trackers.utils.files import load_image_mmap
+
+
+def _write_image(path, value, size=(24, 32)):
+    img = numpy.full((*size, 3), value, dtype=numpy.uint8)
+    assert cv2.imwrite(str(path), img)
+    return img
+
+
+def test_load_image_mmap_decodes(tmp_path):
+    img = _write_image(tmp_path / "a.png", 7)
+    numpy.testing.assert_array_equal(load_image_mmap(tmp_path / "a.png"), img)
+
+
+def test_load_image_mmap_raw_frame(tmp_path):
+    raw = numpy.arange(2 * 3 * 3, dtype=numpy.uint8).reshape(2, 3, 3)
+    (tmp_path / "a.raw").write_bytes(raw.tobytes())
+    numpy.testing.assert_array_equal(load_image_mmap(tmp_path / "a.raw", shape=(2, 3, 3)), raw)
+
+
+def test_load_image_mmap_returns_none_for_bad_entries(tmp_path):
+    (tmp_path / "empty.png").write_bytes(b"")
+    (tmp_path / "garbage.png").write_bytes(b"not an image")
+    (tmp_path / "dir.png").mkdir()
+    assert load_image_mmap(tmp_path / "missing.png") is None
+    assert load_image_mmap(tmp_path / "empty.png") is None
+    assert load_image_mmap(tmp_path / "garbage.png") is None
+    assert load_image_mmap(tmp_path / "dir.png") is None
+
+
+class _FakeSpdlIO(types.ModuleType):
+    """NumPy-backed stand-in for `spdl.io` recording its calls; raises `error` if set."""
+
+    def __init__(self, error=None):
+        super().__init__("spdl.io")
+        self.calls = []
+        self.error = error
+
+    def load_image_batch(self, srcs, width, height, pix_fmt):
+        self.calls.append((list(srcs), width, height, pix_fmt))
+        if self.error is not None:
+            raise self.error
+        return numpy.stack([cv2.resize(cv2.imread(src), (width, height)) for src in srcs])
+
+    def to_numpy(self, buffer):
+        return buffer
+
+
+@pytest.fixture
+def fake_spdl(monkeypatch):
+    def install(error=None):
+        spdl_io = _FakeSpdlIO(error)
+        spdl = types.ModuleType("spdl")
+        spdl.io = spdl_io
+        monkeypatch.setitem(sys.modules, "spdl", spdl)
+        monkeypatch.setitem(sys.modules, "spdl.io", spdl_io)
+        monkeypatch.setattr(files, "_spdl_fallback_warned", False)
+        return spdl_io
+
+    return install
+
+
+def test_load_image_batch_spdl(tmp_path, fake_spdl):
+    spdl_io = fake_spdl()
+    paths = [tmp_path / f"{k}.png" for k in range(4)]
+    imgs = [_write_image(path, 10 * k) for k, path in enumerate(paths)]
+    out = files.load_image_batch(paths)
+    # the first frame is decoded locally to probe the frame size for the rest of the batch
+    assert spdl_io.calls == [([str(p) for p in paths[1:]], 32, 24, "bgr24")]
+    assert len(out) == 4
+    for frame, img in zip(out, imgs, strict=True):
+        numpy.testing.assert_array_equal(frame, img)
+
+
+def test_load_image_batch_spdl_fallback(tmp_path, fake_spdl, caplog):
+    spdl_io = fake_spdl(RuntimeError("decode failed"))
+    paths = [tmp_path / f"{k}.png" for k in range(3)]
+    imgs = [_write_image(path, 10 * k) for k, path in enumerate(paths)]
+    with caplog.at_level(logging.WARNING, logger=files.__name__):
+        out = files.load_image_batch(paths)
+        files.load_image_batch(paths)
+    assert len(spdl_io.calls) == 2
+    assert len(caplog.records) == 1  # warned once
+    assert "falling back" in caplog.records[0].getMessage()
+    for frame, img in zip(out, imgs, strict=True):
+        numpy.testing.assert_array_equal(frame, img)
+
+
+def test_load_image_batch_spdl_misuse_raises(tmp_path, fake_spdl):
+    fake_spdl(TypeError("unexpected keyword argument"))
+    paths = [tmp_path / f"{k}.png" for k in range(2)]
+    for path in paths:
+        _write_image(path, 0)
+    with pytest.raises(TypeError):
+        files.load_image_batch(paths)
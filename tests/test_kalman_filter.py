@@ -0,0 +1,248 @@
+import numpy
+import pytest
+
+from trackobjs.trackers.utils import kalman_filter
+from trackobjs.trackers.utils.kalman_filter import KalmanFilterXYAH, KalmanFilterXYWH
+
+_WP, _WV = 1.0 / 20, 1.0 / 160  # position / velocity noise weights of both filters
+
+
+def _motion_std(cls, mean):
+    if cls is KalmanFilterXYAH:
+        h = mean[3]
+        return [_WP * h, _WP * h, 1e-2, _WP * h, _WV * h, _WV * h, 1e-5, _WV * h]
+    w, h = mean[2], mean[3]
+    return [_WP * w, _WP * h, _WP * w, _WP * h, _WV * w, _WV * h, _WV * w, _WV * h]
+
+
+def _innovation_std(cls, mean):
+    if cls is KalmanFilterXYAH:
+        h = mean[3]
+        return [_WP * h, _WP * h, 1e-1, _WP * h]
+    w, h = mean[2], mean[3]
+    return [_WP * w, _WP * h, _WP * w, _WP * h]
+
+
+def _ref_predict(cls, mean, covariance):
+    """Float64 reference of the prediction step."""
+    mean, covariance = mean.astype(numpy.float64), covariance.astype(numpy.float64)
+    motion_mat = numpy.eye(8)
+    motion_mat[:4, 4:] = numpy.eye(4)
+    motion_cov = numpy.diag(numpy.square(_motion_std(cls, mean)))
+    return motion_mat @ mean, motion_mat @ covariance @ motion_mat.T + motion_cov
+
+
+def _ref_project(cls, mean, covariance):
+    """Float64 reference of the projection step."""
+    mean, covariance = mean.astype(numpy.float64), covariance.astype(numpy.float64)
+    update_mat = numpy.eye(4, 8)
+    innovation_cov = numpy.diag(numpy.square(_innovation_std(cls, mean)))
+    return update_mat @ mean, update_mat @ covariance @ update_mat.T + innovation_cov
+
+
+def _ref_update(cls, mean, covariance, measurement):
+    """Float64 reference of the correction step."""
+    projected_mean, projected_cov = _ref_project(cls, mean, covariance)
+    covariance = covariance.astype(numpy.float64)
+    kalman_gain = covariance @ numpy.eye(4, 8).T @ numpy.linalg.inv(projected_cov)
+    new_mean = mean + kalman_gain @ (measurement - projected_mean)
+    return new_mean, covariance - kalman_gain @ projected_cov @ kalman_gain.T
+
+
+def _states(cls, n, seed=0):
+    """Return `n` float32 states with positive-definite covariances, spread like real tracks."""
+    rng = numpy.random.default_rng(seed)
+    kf = cls()
+    means, covariances = [], []
+    for _ in range(n):
+        size = [rng.uniform(0.3, 2.0), rng.uniform(20, 200)]
+        if cls is KalmanFilterXYWH:
+            size[0] *= size[1]
+        mean, covariance = kf.initiate(numpy.array([*rng.uniform(0, 1000, 2), *size]))
+        mean[4:] = rng.normal(0, 2, 4)
+        a = rng.normal(0, 1, (8, 8))
+        covariances.append(covariance + (a @ a.T).astype(numpy.float32))
+        means.append(mean)
+    return numpy.stack(means), numpy.stack(covariances)
+
+
+def _measurements(cls, means, seed=1):
+    rng = numpy.random.default_rng(seed)
+    return (means[:, :4] * rng.uniform(0.95, 1.05, (len(means), 4))).astype(numpy.float32)
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def backend(request, monkeypatch):
+    """Run a test on the numba kernels and on the NumPy/SciPy fallback."""
+    if request.param == "numba":
+        if kalman_filter.numba is None:
+            pytest.skip("numba is not installed")
+    else:
+        for name in ("_kf_predict_njit", "_kf_project_njit", "_kf_update_njit", "_batch_maha_njit"):
+            monkeypatch.setattr(kalman_filter, name, None)
+    return request.param
+
+
+@pytest.fixture(params=[KalmanFilterXYAH, KalmanFilterXYWH], ids=["xyah", "xywh"])
+def cls(request):
+    return request.param
+
+
+def _assert_close(actual, expected):
+    numpy.testing.assert_allclose(actual, expected, rtol=1e-4, atol=1e-3)
+
+
+def test_initiate_batch_matches_initiate(cls):
+    kf = cls()
+    measurements = _measurements(cls, _states(cls, 5)[0])
+    means, covariances = kf.initiate_batch(measurements)
+    assert means.shape == (5, 8) and covariances.shape == (5, 8, 8)
+    for i, measurement in enumerate(measurements):
+        mean, covariance = kf.initiate(measurement)
+        numpy.testing.assert_allclose(means[i], mean, rtol=1e-6)
+        numpy.testing.assert_allclose(covariances[i], covariance, rtol=1e-6)
+    empty_means, empty_covariances = kf.initiate_batch(numpy.empty((0, 4), numpy.float32))
+    assert empty_means.shape == (0, 8) and empty_covariances.shape == (0, 8, 8)
+
+
+def test_predict(backend, cls):
+    kf = cls()
+    for mean, covariance in zip(*_states(cls, 8), strict=True):
+        new_mean, new_covariance = kf.predict(mean, covariance)
+        assert new_mean.dtype == new_covariance.dtype == numpy.float32
+        ref_mean, ref_covariance = _ref_predict(cls, mean, covariance)
+        _assert_close(new_mean, ref_mean)
+        _assert_close(new_covariance, ref_covariance)
+
+
+def test_project(backend, cls):
+    kf = cls()
+    for mean, covariance in zip(*_states(cls, 8), strict=True):
+        projected_mean, projected_cov = kf.project(mean, covariance)
+        ref_mean, ref_cov = _ref_project(cls, mean, covariance)
+        _assert_close(projected_mean, ref_mean)
+        _assert_close(projected_cov, ref_cov)
+
+
+def test_update(backend, cls):
+    kf = cls()
+    means, covariances = _states(cls, 8)
+    for mean, covariance, measurement in zip(
+        means, covariances, _measurements(cls, means), strict=True
+    ):
+        new_mean, new_covariance = kf.update(mean, covariance, measurement)
+        ref_mean, ref_covariance = _ref_update(cls, mean, covariance, measurement)
+        _assert_close(new_mean, ref_mean)
+        _assert_close(new_covariance, ref_covariance)
+
+
+def test_float64_inputs(backend, cls):
+    kf = cls()
+    means, covariances = _states(cls, 4)
+    for mean, covariance, measurement in zip(
+        means, covariances, _measurements(cls, means), strict=True
+    ):
+        mean, covariance = mean.astype(numpy.float64), covariance.astype(numpy.float64)
+        measurement = measurement.astype(numpy.float64)
+        for result, ref in (
+            (kf.predict(mean, covariance), _ref_predict(cls, mean, covariance)),
+            (kf.project(mean, covariance), _ref_project(cls, mean, covariance)),
+            (
+                kf.update(mean, covariance, measurement),
+                _ref_update(cls, mean, covariance, measurement),
+            ),
+        ):
+            assert result[0].dtype == result[1].dtype == numpy.float32
+            _assert_close(result[0], ref[0])
+            _assert_close(result[1], ref[1])
+
+
+def test_update_not_positive_definite(backend, cls):
+    kf = cls()
+    mean, _ = kf.initiate(numpy.array([100, 100, 1, 50], dtype=numpy.float32))
+    covariance = -1e3 * numpy.eye(8, dtype=numpy.float32)
+    with pytest.raises(numpy.linalg.LinAlgError):
+        kf.update(mean, covariance, mean[:4])
+
+
+def test_multi_predict(cls):
+    kf = cls()
+    means, covariances = _states(cls, 16)
+    new_means, new_covariances = kf.multi_predict(means, covariances)
+    means_into, covariances_into = means.copy(), covariances.copy()
+    kf.multi_predict_into(means_into, covariances_into, numpy.empty((32, 8, 8), numpy.float32))
+    for i in range(len(means)):
+        ref_mean, ref_covariance = _ref_predict(cls, means[i], covariances[i])
+        _assert_close(new_means[i], ref_mean)
+        _assert_close(new_covariances[i], ref_covariance)
+        _assert_close(means_into[i], ref_mean)
+        _assert_close(covariances_into[i], ref_covariance)
+
+
+@pytest.mark.parametrize("only_position", [False, True])
+def test_batch_gating_distance(backend, cls, only_position):
+    kf = cls()
+    means, covariances = _states(cls, 6)
+    measurements = _measurements(cls, means)
+    distances = kf.batch_gating_distance(means, covariances, measurements, only_position)
+    assert distances.shape == (6, 6)
+    k = 2 if only_position else 4
+    for t in range(len(means)):
+        projected_mean, projected_cov = _ref_project(cls, means[t], covariances[t])
+        d = measurements[:, :k] - projected_mean[:k]
+        ref = numpy.einsum("ni,ij,nj->n", d, numpy.linalg.inv(projected_cov[:k, :k]), d)
+        numpy.testing.assert_allclose(distances[t], ref, rtol=1e-3, atol=1e-3)
+        single = kf.gating_distance(means[t], covariances[t], measurements, only_position)
+        numpy.testing.assert_allclose(single, ref, rtol=1e-3, atol=1e-3)
+
+
+def _measurement_at(cls, mean, covariance, squared_distance, only_position):
+    """Return a measurement at the given squared Mahalanobis distance from the projected state."""
+    projected_mean, projected_cov = _ref_project(cls, mean, covariance)
+    k = 2 if only_position else 4
+    u = numpy.ones(k)
+    d = u * numpy.sqrt(squared_distance / (u @ numpy.linalg.solve(projected_cov[:k, :k], u)))
+    measurement = projected_mean.copy()
+    measurement[:k] += d
+    return measurement.astype(numpy.float32)
+
+
+@pytest.mark.parametrize("only_position", [False, True])
+def test_gating_mask(backend, cls, only_position):
+    kf = cls()
+    means, covariances = _states(cls, 3)
+    # squared distances on both sides of the 95% gate of the matching degrees of freedom
+    threshold = kalman_filter.chi2inv95[2 if only_position else 4]
+    distances = [0.5 * threshold, 0.9 * threshold, 1.1 * threshold, 3 * threshold]
+    expected = numpy.array([True, True, False, False])
+
+    for mean, covariance in zip(means, covariances, strict=True):
+        measurements = numpy.stack(
+            [_measurement_at(cls, mean, covariance, d, only_position) for d in distances]
+        )
+        mask = kf.gating_mask(mean, covariance, measurements, only_position=only_position)
+        assert mask.shape == (4,) and mask.dtype == bool
+        numpy.testing.assert_array_equal(mask, expected)
+        numpy.testing.assert_array_equal(
+            kf.gating_mask(mean, covariance, measurements, 1e9, only_position), True
+        )
+
+    measurements = numpy.stack(
+        [_measurement_at(cls, means[0], covariances[0], d, only_position) for d in distances]
+    )
+    mask = kf.gating_mask(means, covariances, measurements, only_position=only_position)
+    assert mask.shape == (3, 4)
+    numpy.testing.assert_array_equal(mask[0], expected)
+    ref = kf.batch_gating_distance(means, covariances, measurements, only_position) <= threshold
+    numpy.testing.assert_array_equal(mask, ref)
+
+
+def test_gating_mask_default_threshold_follows_only_position(cls):
+    kf = cls()
+    mean, covariance = _states(cls, 1)
+    mean, covariance = mean[0], covariance[0]
+    # between chi2inv95[2] (5.99) and chi2inv95[4] (9.49): outside the 2-dof gate only
+    measurement = _measurement_at(cls, mean, covariance, 7.5, only_position=True)[None]
+    assert not kf.gating_mask(mean, covariance, measurement, only_position=True)[0]
+    threshold = kalman_filter.chi2inv95[4]
+    assert kf.gating_mask(mean, covariance, measurement, threshold, only_position=True)[0]
@@ -0,0 +1,56 @@
+import numpy
+
+from trackobjs.trackers.utils import matching
+from trackobjs.trackers.utils.metrics import batch_probiou, bbox_ioa
+
+
+def test_iou_distance_boxes():
+    atracks = [numpy.array([0, 0, 10, 10]), numpy.array([20, 20, 30, 30])]
+    btracks = [
+        numpy.array([5, 0, 15, 10]),
+        numpy.array([20, 20, 30, 30]),
+        numpy.array([50, 50, 60, 60]),
+    ]
+    cost = matching.iou_distance(atracks, btracks)
+    assert cost.shape == (2, 3)
+    numpy.testing.assert_allclose(cost, [[2 / 3, 1, 1], [1, 0, 1]], atol=1e-5)
+
+
+def test_iou_distance_oriented_boxes():
+    boxes = numpy.array([[10, 10, 4, 2, 0.0], [10, 10, 4, 2, numpy.pi / 2], [50, 50, 4, 2, 0.0]])
+    cost = matching.iou_distance(list(boxes), list(boxes))
+    assert cost.shape == (3, 3)
+    numpy.testing.assert_allclose(numpy.diag(cost), 0, atol=1e-2)
+    assert cost[0, 2] > 0.99 and 0 < cost[0, 1] < 1
+
+
+def test_iou_distance_empty():
+    assert matching.iou_distance([], [numpy.array([0, 0, 1, 1])]).shape == (0, 1)
+
+
+def test_bbox_ioa_matches_intersection_over_box2():
+    box1 = numpy.array([[0, 0, 10, 10]], dtype=numpy.float32)
+    box2 = numpy.array([[5, 0, 10, 10], [20, 20, 30, 30]], dtype=numpy.float32)
+    numpy.testing.assert_allclose(bbox_ioa(box1, box2), [[1, 0]], atol=1e-5)
+    numpy.testing.assert_allclose(bbox_ioa(box1, box2, iou=True), [[0.5, 0]], atol=1e-5)
+
+
+def test_batch_probiou_is_symmetric():
+    obb = numpy.array([[10, 10, 4, 2, 0.3], [12, 9, 6, 3, 1.0]], dtype=numpy.float32)
+    sim = batch_probiou(obb, obb).numpy()
+    numpy.testing.assert_allclose(sim, sim.T, atol=1e-5)
+
+
+def test_linear_assignment_thresholds_matches():
+    cost = numpy.array([[0.1, 0.9, 0.8], [0.8, 0.7, 0.9]])
+    matches, unmatched_a, unmatched_b = matching.linear_assignment(cost, thresh=0.5)
+    assert matches.tolist() == [[0, 0]]
+    assert unmatched_a == [1]
+    assert unmatched_b == [1, 2]
+
+
+def test_linear_assignment_empty():
+    matches, unmatched_a, unmatched_b = matching.linear_assignment(numpy.empty((2, 0)), thresh=0.5)
+    assert matches.shape == (0, 2)
+    assert unmatched_a == [0, 1]
+    assert unmatched_b == []
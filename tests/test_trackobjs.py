@@ -0,0 +1,132 @@
+import os
+import subprocess
+import sys
+
+import cv2
+import numpy
+import pytest
+
+from trackobjs import _trackobjs
+from trackobjs._trackobjs import merge_tracklets, track_objects
+
+
+def _tracks(*rows):
+    """Build (x1, y1, x2, y2, id, score, cls, idx) tracker output rows; no rows gives shape (0,)."""
+    return numpy.asarray(
+        [[*box, track_id, 0.9, 0, i] for i, (box, track_id) in enumerate(rows)], dtype=numpy.float32
+    )
+
+
+def _ids(tracks):
+    return tracks[:, -4].astype(int).tolist() if len(tracks) else []
+
+
+def test_merge_tracklets_links_across_boundary():
+    window_a = [("0", _tracks(((0, 0, 10, 10), 1))), ("1", _tracks(((1, 0, 11, 10), 1)))]
+    window_b = [("2", _tracks(((2, 0, 12, 10), 1))), ("3", _tracks(((3, 0, 13, 10), 1)))]
+    merged = merge_tracklets([window_a, window_b])
+    assert [ts for ts, _ in merged] == ["0", "1", "2", "3"]
+    assert [_ids(tracks) for _, tracks in merged] == [[1], [1], [1], [1]]
+
+
+def test_merge_tracklets_fresh_id_when_unlinked():
+    window_a = [("0", _tracks(((0, 0, 10, 10), 1), ((50, 50, 60, 60), 2)))]
+    # local id 1 overlaps the first track, local id 2 is far from both
+    window_b = [("1", _tracks(((1, 0, 11, 10), 1), ((200, 200, 210, 210), 2)))]
+    merged = merge_tracklets([window_a, window_b])
+    assert _ids(merged[0][1]) == [1, 2]
+    assert _ids(merged[1][1]) == [1, 3]
+
+
+def test_merge_tracklets_does_not_modify_inputs():
+    tracks = _tracks(((0, 0, 10, 10), 7))
+    merge_tracklets([[("0", tracks)]])
+    assert _ids(tracks) == [7]
+
+
+def test_merge_tracklets_empty_windows():
+    assert merge_tracklets([]) == []
+    window = [("0", _tracks(((0, 0, 10, 10), 5)))]
+    merged = merge_tracklets([[], window, []])
+    assert [ts for ts, _ in merged] == ["0"]
+    assert _ids(merged[0][1]) == [1]
+
+
+def test_merge_tracklets_empty_track_arrays():
+    empty = _tracks()
+    assert empty.shape == (0,)
+    window_a = [("0", _tracks(((0, 0, 10, 10), 1))), ("1", empty)]
+    window_b = [("2", empty), ("3", _tracks(((0, 0, 10, 10), 1)))]
+    merged = merge_tracklets([window_a, window_b])
+    assert [_ids(tracks) for _, tracks in merged] == [[1], [], [], [2]]
+    assert merged[1][1].shape == (0,)
+
+
+class _StubTracker:
+    """Tracker stand-in giving the i-th detection of every frame the local id i + 1."""
+
+    instances = []
+
+    def __init__(self, args, frame_rate=30):
+        self.args = args
+        self.frames = []
+        _StubTracker.instances.append(self)
+
+    def update(self, dets, img):
+        self.frames.append(img.shape)
+        return _tracks(*((box, i + 1) for i, box in enumerate(dets.xyxy.tolist())))
+
+
+@pytest.fixture
+def datadir(tmp_path):
+    """Six 64x64 frames with one box moving right by one pixel per frame; frame 3 has no file."""
+    timestamps = [f"{1000 + k}" for k in range(6)]
+    os.makedirs(tmp_path / "images")
+    os.makedirs(tmp_path / "detections")
+    for k, ts in enumerate(timestamps):
+        cv2.imwrite(str(tmp_path / "images" / f"{ts}.png"), numpy.zeros((64, 64, 3), numpy.uint8))
+        if k != 3:
+            (tmp_path / "detections" / f"{ts}.txt").write_text(f"{10 + k} 10 {30 + k} 30 0.9 0\n")
+    (tmp_path / "timestamps.txt").write_text("\n".join(timestamps) + "\n")
+    return tmp_path
+
+
+def test_track_objects_with_stub_tracker(datadir, monkeypatch):
+    _StubTracker.instances = []
+    monkeypatch.setitem(_trackobjs.tracker_classmap, "stub", lambda: _StubTracker)
+    monkeypatch.setitem(
+        _trackobjs.tracker_cfg_pathmap, "stub", _trackobjs.tracker_cfg_pathmap["botsort"]
+    )
+    merged = track_objects(str(datadir), "stub", window_size=2, n_jobs=1, render_workers=0)
+
+    assert len(_StubTracker.instances) == 3  # one fresh tracker per window
+    assert all(tracker.frames == [(64, 64, 3)] * 2 for tracker in _StubTracker.instances)
+    assert [ts for ts, _ in merged] == [f"{1000 + k}" for k in range(6)]
+    # frame 3 has no detections, so window 3 starts a new track; windows 1 and 2 are linked
+    assert [_ids(tracks) for _, tracks in merged] == [[1], [1], [1], [], [2], [2]]
+    rendered = sorted(os.listdir(datadir / "visz_objdets_tracks"))
+    assert rendered == [f"{1000 + k}.png" for k in range(6)]
+
+
+def test_track_objects_missing_inputs(datadir):
+    os.rename(datadir / "detections", datadir / "dets")
+    with pytest.raises(FileNotFoundError, match="Detections directory"):
+        track_objects(str(datadir), render_workers=0)
+
+
+def test_track_objects_with_botsort(datadir):
+    merged = track_objects(str(datadir), window_size=3, n_jobs=1, render_workers=0)
+    # the second window starts on the empty frame 3, so its track is only confirmed on its second
+    # hit (frame 5) and gets a new global id
+    assert [_ids(tracks) for _, tracks in merged] == [[1], [1], [1], [], [], [2]]
+
+
+def test_cli_help_skips_heavy_imports():
+    code = (
+        "import sys, runpy; sys.argv = ['trackobjs', '--help']\n"
+        "try:\n    runpy.run_module('trackobjs', run_name='__main__')\n"
+        "except SystemExit:\n    pass\n"
+        "print(sorted({'cv2', 'numpy', 'joblib'} & set(sys.modules)))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip().splitlines()[-1] == "[]"